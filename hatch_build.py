@@ -0,0 +1,19 @@
+import importlib.util
+import os
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class ToolsManifestHook(BuildHookInterface):
+    """
+    Regenerates src/zrcl/_tools_manifest.py before every build, so the wheel
+    ships the tool table for exactly the tools it contains.
+    """
+
+    def initialize(self, version, build_data):
+        # load the generator by path, the package itself isn't importable here
+        path = os.path.join(self.root, "src", "zrcl", "build_manifest.py")
+        spec = importlib.util.spec_from_file_location("_zrcl_build_manifest", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.write_manifest()
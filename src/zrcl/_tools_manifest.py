@@ -0,0 +1,6 @@
+# generated by `python -m zrcl.build_manifest`, do not edit
+TOOLS = {
+    "btype": ("zrcl.tool_btype", "run", "a typewriter"),
+    "coord_1": ("zrcl.tool_coord_1", "run", "a tracker for mouse coordinates"),
+    "sysinfo": ("zrcl.tool_sysinfo", "run", None),
+}
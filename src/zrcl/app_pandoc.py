@@ -1,6 +1,6 @@
-import os
+import subprocess
 
-from zrcl.markdown import create_yaml_properties
+from zrcl.markdown import format_yaml_properties
 
 
 def pandoc_generate_file_from_data(
@@ -21,18 +21,32 @@ def pandoc_generate_file_from_data(
     Returns:
         None
 
-    This function generates a file using Pandoc from input data. It first calls the
-    `create_yaml_properties` function to create YAML properties in the current working
-    directory using the provided data. Then it uses the `os.system` function to run the
-    `pandoc` command to generate the file. The command takes the input file "input.md",
-    generates the output file with the specified name, and uses the specified output type,
-    markdown as the input format, and the provided template.
+    Raises:
+        subprocess.CalledProcessError: If pandoc exits with a non-zero status.
+
+    This function generates a file using Pandoc from input data. It renders the data
+    as YAML front matter with `format_yaml_properties` and pipes it to `pandoc` on
+    stdin, so no intermediate "input.md" is written. Pandoc is executed directly
+    without a shell, reading markdown from stdin and writing the output file with the
+    specified name, output type and template.
 
     Note:
         The function assumes that the `pandoc` command is available in the system's PATH.
     """
-    create_yaml_properties(os.path.join(os.getcwd(), "input.md"), data)
-
-    os.system(
-        f'pandoc input.md -o {outname} -f markdown -t {outtype} --template="{template}"'
+    subprocess.run(
+        [
+            "pandoc",
+            "-",
+            "-o",
+            outname,
+            "-f",
+            "markdown",
+            "-t",
+            outtype,
+            "--template",
+            template,
+        ],
+        input=format_yaml_properties(data),
+        text=True,
+        check=True,
     )
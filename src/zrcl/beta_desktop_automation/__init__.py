@@ -1,4 +1,3 @@
-from contextlib import contextmanager
 import logging
 from zrcl.beta_desktop_automation.feature_cropper import FeatureCropper
 import time
@@ -11,10 +10,11 @@ def waitFor(token: FeatureCropper, timeout: float = 10.0, interval: float = 1.1)
     Args:
         token (FeatureCropper): The token function to be called.
         timeout (float, optional): The maximum amount of time to wait for the token function to return a truthy value. Defaults to 10.0.
-        interval (float, optional): The time interval between each call to the token function. Defaults to 1.1.
+        interval (float, optional): The maximum time interval between each call to the token function.
+            The wait starts at 0.1 seconds and backs off exponentially up to this value. Defaults to 1.1.
 
     Returns:
-        The last result of calling the token function.
+        The first truthy result of calling the token function.
 
     Raises:
         TimeoutError: If the token function does not return a truthy value within the specified timeout.
@@ -23,25 +23,30 @@ def waitFor(token: FeatureCropper, timeout: float = 10.0, interval: float = 1.1)
         The token function should return a truthy value to indicate success or a falsy value to indicate failure.
         If the token function raises an exception, it will be logged and the function will continue to wait.
     """
-    currentTime = time.time()
-    while time.time() - currentTime < timeout:
+    deadline = time.monotonic() + timeout
+    delay = min(0.1, interval)
+    while True:
         try:
-            if token():
-                break
-        except Exception as e:
-            logging.error(e)
+            result = token()
+            if result:
+                return result
+        except Exception:
+            logging.exception("waitFor token raised")
 
-        time.sleep(interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Timed out")
 
-    if not token._lastResult:
-        raise TimeoutError("Timed out")
-    return token._lastResult
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, interval)
 
 
-@contextmanager
 def repeatWith(token: FeatureCropper, times: int = 1):
     """
-    A context manager that repeatedly yields the result of calling the given token function.
+    A generator that repeatedly yields the result of calling the given token function.
+
+    All calls share one screenshot, which is only retaken if the token's region
+    marker is mutated in between.
 
     Args:
         token (FeatureCropper): The token function to be called.
@@ -49,10 +54,7 @@ def repeatWith(token: FeatureCropper, times: int = 1):
 
     Yields:
         The result of calling the token function.
-
-    Returns:
-        The last result of calling the token function.
     """
-    for _ in range(times):
-        yield token()
-    return token._lastResult
+    with token.regionMarker.pinned():
+        for _ in range(times):
+            yield token()
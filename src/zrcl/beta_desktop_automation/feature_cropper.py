@@ -1,10 +1,22 @@
+from collections import OrderedDict
 from dataclasses import dataclass, field
+import hashlib
 import typing
+import cv2
+import numpy
 import pyscreeze
+from PIL import Image
 from zrcl.beta_desktop_automation.region_marker import RegionMarker
 from zrcl.ext_easyocr import get_text_coords
 import pyautogui
 
+_MIN_PYRAMID_SIZE = 8
+_MAX_PYRAMID_CANDIDATES = 16
+_PYRAMID_PAD = 4
+
+_OCR_CACHE_SIZE = 32
+_OCR_CACHE = OrderedDict()
+
 
 @dataclass
 class FeatureCropper:
@@ -16,11 +28,21 @@ class FeatureCropper:
     regionMarker: RegionMarker
     recognitionParams: dict = field(default_factory=dict)
     desktopAutomationStep: typing.Callable = lambda x, y: pyautogui.click(x, y)
-    _lastResults = None
-    _lastScreenshot = None
-    _lastMatches = None
-    _lastMatch = None
-    _lastResult = None
+    _lastResults: typing.Any = field(default=None, init=False, repr=False)
+    _lastScreenshot: typing.Any = field(default=None, init=False, repr=False)
+    _lastMatches: typing.Any = field(default=None, init=False, repr=False)
+    _lastMatch: typing.Any = field(default=None, init=False, repr=False)
+    _lastResult: typing.Any = field(default=None, init=False, repr=False)
+    _matchSrc: typing.Optional[str] = field(default=None, init=False, repr=False)
+    _matchFn: typing.Optional[typing.Callable] = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        """
+        Post initialization step
+        """
+        pass
 
     def _preprocessing(self):
         """
@@ -40,6 +62,22 @@ class FeatureCropper:
         """
         pass
 
+    def _compile_target_match(self):
+        """
+        Compile the target match string into a function, once per expression
+        """
+        if self._matchSrc != self.targetMatch:
+            self._matchFn = eval(
+                compile(
+                    "lambda result, self: (" + self.targetMatch + ")",
+                    "<targetMatch>",
+                    "eval",
+                ),
+                {},
+            )
+            self._matchSrc = self.targetMatch
+        return self._matchFn
+
     def _target_match(self, results):
         """
         Match the results with the target
@@ -48,18 +86,12 @@ class FeatureCropper:
             results = [results]
 
         if isinstance(self.targetMatch, str):
-
-            def targetMatchFunc(result):
-                """
-                Evaluate the target match string
-                """
-                evaluated = eval(self.targetMatch, {"result": result, "self": self})
-                return evaluated
-
+            matchFn = self._compile_target_match()
+            aggResults = [result for result in results if matchFn(result, self)]
         else:
-            targetMatchFunc = self.targetMatch
+            matchFn = self.targetMatch
+            aggResults = [result for result in results if matchFn(result)]
 
-        aggResults = [result for result in results if targetMatchFunc(result)]
         self._lastMatches = aggResults
         return aggResults
 
@@ -91,6 +123,7 @@ class ClosestOcr(FeatureCropper):
         """
         Post initialization step
         """
+        super().__post_init__()
         if isinstance(self.targetMatch, str):
             self.targetMatch = f"result[3] == '{self.targetMatch}'"
 
@@ -100,9 +133,31 @@ class ClosestOcr(FeatureCropper):
         """
         screenshot = self.regionMarker.screenshot
         self._lastScreenshot = screenshot
-        results = get_text_coords(screenshot, **self.recognitionParams)
+
+        # polling usually hands in the same frame several times, ocr it once
+        key = (
+            screenshot.size,
+            hashlib.blake2b(screenshot.tobytes(), digest_size=16).digest(),
+            repr(sorted(self.recognitionParams.items())),
+        )
+        entry = _OCR_CACHE.get(key)
+        if entry is None:
+            results = get_text_coords(screenshot, **self.recognitionParams)
+            confidences = numpy.fromiter(
+                (result[2] for result in results), numpy.float32, len(results)
+            )
+            entry = (results, confidences)
+            _OCR_CACHE[key] = entry
+            if len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+                _OCR_CACHE.popitem(last=False)
+        else:
+            _OCR_CACHE.move_to_end(key)
+
         # confidence filter
-        results = [result for result in results if result[2] >= self.confidence]
+        results, confidences = entry
+        results = [
+            results[i] for i in numpy.flatnonzero(confidences >= self.confidence)
+        ]
 
         self._lastResults = results
         return results
@@ -112,14 +167,21 @@ class ClosestOcr(FeatureCropper):
         Parse the results and return the closest OCR match
         """
         matched = self._target_match(results)
-        # get closest match
-        closest_match = max(matched, key=lambda result: result[2])
-        self._lastMatch = closest_match
+        if not matched:
+            return None
 
-        top_left, _, bottom_right, _ = closest_match[0]
-        center_x = (top_left[0] + bottom_right[0]) / 2
-        center_y = (top_left[1] + bottom_right[1]) / 2
+        # get closest match
+        confidences = numpy.fromiter(
+            (result[2] for result in matched), numpy.float32, len(matched)
+        )
+        corners = numpy.array(
+            [(result[0], result[1]) for result in matched], dtype=numpy.float32
+        )
+        centers = (corners[:, 0] + corners[:, 1]) * 0.5
+        best = int(numpy.argmax(confidences))
+        self._lastMatch = matched[best]
 
+        center_x, center_y = centers[best].tolist()
         self._lastResult = (center_x, center_y)
         return center_x, center_y
 
@@ -134,6 +196,15 @@ class ImageMatcher(FeatureCropper):
     targetImage: typing.Union[str, typing.Any] = None
     confidence: float = 0.6
     matchAlgorithm: str = "auto"  # Assume 'auto' or could be specific like 'cv2'
+    pyramidLevels: int = 3
+    grayscale: bool = True
+    _tplSrc: typing.Any = field(default=None, init=False, repr=False)
+    _tplPyramid: typing.Optional[list] = field(default=None, init=False, repr=False)
+    _tpl_w: int = field(default=0, init=False, repr=False)
+    _tpl_h: int = field(default=0, init=False, repr=False)
+    _resultBuf: typing.Optional[numpy.ndarray] = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self):
         """
@@ -145,18 +216,151 @@ class ImageMatcher(FeatureCropper):
                 f"result['confidence'] >= {self.confidence} and {self.targetMatch}"
             )
 
+    def _load_target(self):
+        """
+        Load the target image as a grayscale (or BGR) uint8 array
+        """
+        image = self.targetImage
+        if isinstance(image, str):
+            loaded = cv2.imread(
+                image, cv2.IMREAD_GRAYSCALE if self.grayscale else cv2.IMREAD_COLOR
+            )
+            if loaded is None:
+                raise FileNotFoundError(f"Could not read target image {image!r}")
+            return loaded
+        if isinstance(image, Image.Image):
+            image = numpy.asarray(image.convert("RGB"))
+            return cv2.cvtColor(
+                image, cv2.COLOR_RGB2GRAY if self.grayscale else cv2.COLOR_RGB2BGR
+            )
+
+        # arrays are taken to be in OpenCV's own BGR(A) / gray layout; bring
+        # them to the channel count the haystack is matched in
+        image = numpy.asarray(image)
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        if channels == 1:
+            if image.ndim == 3:
+                image = image[:, :, 0]
+            return image if self.grayscale else cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        if channels == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if self.grayscale else image
+        if channels == 4:
+            return cv2.cvtColor(
+                image, cv2.COLOR_BGRA2GRAY if self.grayscale else cv2.COLOR_BGRA2BGR
+            )
+        raise ValueError(f"Unsupported target image shape {image.shape}")
+
+    def _needle_pyramid(self):
+        """
+        Build the template pyramid, once per target image
+        """
+        if self._tplPyramid is None or self._tplSrc is not self.targetImage:
+            tpl = self._load_target()
+            self._tpl_h, self._tpl_w = tpl.shape[:2]
+
+            pyramid = [tpl]
+            # stop before the template gets too small to carry any signal
+            while (
+                len(pyramid) < self.pyramidLevels
+                and min(pyramid[-1].shape[:2]) >= 2 * _MIN_PYRAMID_SIZE
+            ):
+                pyramid.append(cv2.pyrDown(pyramid[-1]))
+
+            self._tplPyramid = pyramid
+            self._tplSrc = self.targetImage
+        return self._tplPyramid
+
+    def _locate(self, haystack):
+        """
+        Locate the template in a haystack of the same color mode, coarse to fine
+
+        Returns:
+            typing.Optional[pyscreeze.Box]: The best match above `confidence`, if any.
+        """
+        tplPyramid = self._needle_pyramid()
+        tpl = tplPyramid[0]
+        th, tw = self._tpl_h, self._tpl_w
+        if th > haystack.shape[0] or tw > haystack.shape[1]:
+            return None
+
+        if tpl.shape == haystack.shape:
+            # single placement, plain normalized cross correlation
+            a = tpl - tpl.mean(dtype=numpy.float64)
+            b = haystack - haystack.mean(dtype=numpy.float64)
+            denom = numpy.sqrt((a * a).sum() * (b * b).sum())
+            score = (a * b).sum() / denom if denom else 0.0
+            return pyscreeze.Box(0, 0, tw, th) if score >= self.confidence else None
+
+        hayPyramid = [haystack]
+        for _ in range(len(tplPyramid) - 1):
+            hayPyramid.append(cv2.pyrDown(hayPyramid[-1]))
+
+        # coarsest level, loose threshold to collect candidates
+        level = len(tplPyramid) - 1
+        hay = hayPyramid[level]
+        tpl = tplPyramid[level]
+        shape = (hay.shape[0] - tpl.shape[0] + 1, hay.shape[1] - tpl.shape[1] + 1)
+        if self._resultBuf is None or self._resultBuf.shape != shape:
+            self._resultBuf = numpy.empty(shape, numpy.float32)
+        res = cv2.matchTemplate(hay, tpl, cv2.TM_CCOEFF_NORMED, result=self._resultBuf)
+
+        _, maxVal, _, maxLoc = cv2.minMaxLoc(res)
+        if level == 0:
+            if maxVal < self.confidence:
+                return None
+            return pyscreeze.Box(maxLoc[0], maxLoc[1], tw, th)
+        if maxVal < self.confidence * 0.9:
+            return None
+
+        points = cv2.findNonZero((res >= self.confidence * 0.9).astype(numpy.uint8))
+        if points is None:
+            return None
+        points = points.reshape(-1, 2)
+        order = numpy.argsort(-res[points[:, 1], points[:, 0]])
+        candidates = [
+            (int(x), int(y)) for x, y in points[order[:_MAX_PYRAMID_CANDIDATES]]
+        ]
+
+        # refine each candidate inside a padded roi on the finer levels
+        best = None
+        for level in range(level - 1, -1, -1):
+            hay = hayPyramid[level]
+            tpl = tplPyramid[level]
+            lh, lw = tpl.shape[:2]
+            threshold = self.confidence if level == 0 else self.confidence * 0.9
+            refined = []
+            for x, y in candidates:
+                x0 = max(2 * x - _PYRAMID_PAD, 0)
+                y0 = max(2 * y - _PYRAMID_PAD, 0)
+                x1 = min(2 * x + lw + _PYRAMID_PAD, hay.shape[1])
+                y1 = min(2 * y + lh + _PYRAMID_PAD, hay.shape[0])
+                if x1 - x0 < lw or y1 - y0 < lh:
+                    continue
+                res = cv2.matchTemplate(hay[y0:y1, x0:x1], tpl, cv2.TM_CCOEFF_NORMED)
+                _, maxVal, _, maxLoc = cv2.minMaxLoc(res)
+                if maxVal >= threshold:
+                    refined.append((maxVal, x0 + maxLoc[0], y0 + maxLoc[1]))
+
+            if not refined:
+                return None
+            refined.sort(reverse=True)
+            best = refined[0]
+            candidates = list(dict.fromkeys((x, y) for _, x, y in refined))
+
+        return pyscreeze.Box(best[1], best[2], tw, th)
+
     def _crop(self):
         """
         Crop the screenshot
         """
-        screenshot = self.regionMarker.screenshot
+        # match on the raw BGRA capture, skipping the PIL round-trip
+        screenshot = self.regionMarker.screenshotArray
         self._lastScreenshot = screenshot
-        results = pyscreeze.locate(
-            self.targetImage,
+        haystack = cv2.cvtColor(
             screenshot,
-            confidence=self.confidence,
-            algo=self.matchAlgorithm,
+            cv2.COLOR_BGRA2GRAY if self.grayscale else cv2.COLOR_BGRA2BGR,
         )
+        results = self._locate(haystack)
         if results:
             self._lastResults = results
         return results
@@ -166,12 +370,10 @@ class ImageMatcher(FeatureCropper):
         Parse the results and return the image match
         """
         if results:
-            box = pyscreeze.Box(
-                results
-            )  # assuming Box is a valid type from pyscreeze that handles rectangles
-            center_x = box.left + box.width / 2
-            center_y = box.top + box.height / 2
-            self._lastMatch = box
+            left, top, width, height = results
+            center_x = left + width / 2
+            center_y = top + height / 2
+            self._lastMatch = results
             self._lastResult = (center_x, center_y)
             return center_x, center_y
         return None
@@ -1,12 +1,28 @@
-import copy
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass, field
+import threading
+import time
 from typing import Optional
+import mss
+import numpy
 import pygetwindow as gw
-from PIL import ImageGrab
+from PIL import Image
 
 from zrcl.ext_pygetwindow import get_window_pos
 from zrcl.ext_screeninfo import get_monitor_bounds
 
+_local = threading.local()
+
+
+def _get_sct():
+    """
+    Returns the mss grabber of the current thread, creating it on first use.
+    """
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss.mss()
+    return sct
+
 
 @dataclass
 class RegionSpec:
@@ -65,6 +81,13 @@ class RegionSpec:
         """
         return cls(width_x=0, width_y=1, height_x=0, height_y=1)
 
+    @property
+    def _coeffs(self):
+        """
+        The (x1, y1, x2, y2) fractions of the parent bbox, in bbox order.
+        """
+        return (self.width_x, self.height_x, self.width_y, self.height_y)
+
     @property
     def isFull(self):
         """
@@ -90,6 +113,7 @@ class RegionMarker:
     monitor_num: Optional[int] = None
     window: Optional[gw.Window] = None
     allscreens: bool = False
+    cacheTTL: float = 0.05
 
     @classmethod
     def all_screens(cls):
@@ -123,24 +147,50 @@ class RegionMarker:
         self.__screenshotted = False
         self.__monitor_num_mirror = self.monitor_num
         self.__window_coords_mirror = None
-
-    @property
-    def screenshot(self):
+        self._cacheKey = None
+        self._cacheTime = 0.0
+        self._shotCache = None
+        self._imageCache = None
+        self._pinned = False
+
+    @contextmanager
+    def pinned(self):
         """
-        Returns a screenshot of the specified region of the screen.
+        Reuse one screenshot for the duration of the block, ignoring `cacheTTL`.
 
-        If a window is specified, the screenshot is taken of the entire window.
-        If a monitor number is specified, the screenshot is taken of the entire monitor.
-        If neither a window nor a monitor number is specified, the screenshot is taken of the entire screen.
+        The first grab inside the outermost block is always fresh; after that a new
+        screenshot is only taken if the window position, monitor or region changes.
+        """
+        previous = self._pinned
+        if not previous:
+            # don't let a shot from before the block stand in for the whole block
+            self._cacheKey = None
+        self._pinned = True
+        try:
+            yield self
+        finally:
+            self._pinned = previous
+
+    def _grab(self):
+        """
+        Grabs the specified region of the screen with the thread's mss grabber.
 
-        If a RegionSpec is provided, the screenshot is taken of the specified region within the window or monitor.
+        Consecutive calls within `cacheTTL` seconds for an unchanged window position, monitor
+        and region return the previously grabbed image.
 
         Returns:
-            PIL.Image.Image: The screenshot image.
+            mss.screenshot.ScreenShot: The raw BGRA capture.
         """
-        if self.window:
-            wnd_pos = get_window_pos(self.window)
-            self.__window_coords_mirror = copy.deepcopy(wnd_pos)
+        wnd_pos = get_window_pos(self.window) if self.window else None
+        key = (wnd_pos, self.monitor_num, astuple(self.region), self.allscreens)
+        if key == self._cacheKey and (
+            self._pinned or time.monotonic() - self._cacheTime < self.cacheTTL
+        ):
+            return self._shotCache
+
+        bbox = None
+        if wnd_pos:
+            self.__window_coords_mirror = tuple(wnd_pos)
             bbox = (
                 wnd_pos[0],
                 wnd_pos[1],
@@ -150,19 +200,68 @@ class RegionMarker:
         elif self.monitor_num is not None:
             bbox = get_monitor_bounds(self.monitor_num)
 
-        # Adjust the region based on the RegionSpec if not capturing all screens
-        if bbox and not self.region.isFull:
+        sct = _get_sct()
+        if bbox is None:
+            monitor = sct.monitors[0 if self.allscreens else 1]
+        else:
             x1, y1, x2, y2 = bbox
-            new_x1 = x1 + self.region.width_x * (x2 - x1)
-            new_y1 = y1 + self.region.height_x * (y2 - y1)
-            new_x2 = x1 + self.region.width_y * (x2 - x1)
-            new_y2 = y1 + self.region.height_y * (y2 - y1)
-            bbox = (new_x1, new_y1, new_x2, new_y2)
-
-        # Take the screenshot using PIL
-        image = ImageGrab.grab(bbox, all_screens=self.allscreens)
+            # Adjust the region based on the RegionSpec if not capturing all screens
+            if not self.region.isFull:
+                cx1, cy1, cx2, cy2 = self.region._coeffs
+                dw = x2 - x1
+                dh = y2 - y1
+                x1, y1, x2, y2 = (
+                    x1 + cx1 * dw,
+                    y1 + cy1 * dh,
+                    x1 + cx2 * dw,
+                    y1 + cy2 * dh,
+                )
+            monitor = {
+                "left": int(x1),
+                "top": int(y1),
+                "width": int(x2 - x1),
+                "height": int(y2 - y1),
+            }
+
+        shot = sct.grab(monitor)
+        self._cacheKey = key
+        self._cacheTime = time.monotonic()
+        self._shotCache = shot
+        self._imageCache = None
         self.__screenshotted = True
-        return image
+        return shot
+
+    @property
+    def screenshot(self):
+        """
+        Returns a screenshot of the specified region of the screen.
+
+        If a window is specified, the screenshot is taken of the entire window.
+        If a monitor number is specified, the screenshot is taken of the entire monitor.
+        If neither a window nor a monitor number is specified, the screenshot is taken of the entire screen.
+
+        If a RegionSpec is provided, the screenshot is taken of the specified region within the window or monitor.
+
+        Returns:
+            PIL.Image.Image: The screenshot image.
+        """
+        shot = self._grab()
+        if self._imageCache is None:
+            self._imageCache = Image.frombytes("RGB", shot.size, shot.rgb)
+        return self._imageCache
+
+    @property
+    def screenshotArray(self):
+        """
+        Returns the screenshot as a BGRA numpy array without a PIL round-trip.
+
+        Returns:
+            numpy.ndarray: A read-only (height, width, 4) uint8 view of the capture.
+        """
+        shot = self._grab()
+        return numpy.frombuffer(shot.bgra, dtype=numpy.uint8).reshape(
+            shot.height, shot.width, 4
+        )
 
     @property
     def mutated(self):
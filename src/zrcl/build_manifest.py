@@ -0,0 +1,75 @@
+"""
+Generates `zrcl/_tools_manifest.py`, the literal tool table tool_runner
+dispatches from, so the CLI never has to discover tools at runtime.
+
+Run with `python -m zrcl.build_manifest`; the hatch build hook runs it on
+every build. Only the standard library is used, and tool modules are read
+with ast rather than imported, so their GUI dependencies don't have to be
+installed.
+"""
+
+import ast
+import json
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(PACKAGE_DIR, "_tools_manifest.py")
+ENTRY_POINT = "run"
+
+
+def scan_tools(directory: str = PACKAGE_DIR):
+    """
+    Finds the `tool_*` modules in `directory` that define a top level `run`.
+
+    Returns:
+        dict: tool name -> (module name, entry point, docstring or None)
+    """
+    tools = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.startswith("tool_") or not filename.endswith(".py"):
+            continue
+        module = filename[:-3]
+        if module == "tool_runner":
+            continue
+
+        with open(os.path.join(directory, filename), "rb") as f:
+            tree = ast.parse(f.read(), filename)
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == ENTRY_POINT:
+                tools[module[5:]] = (
+                    f"zrcl.{module}",
+                    ENTRY_POINT,
+                    ast.get_docstring(node),
+                )
+                break
+    return tools
+
+
+def render_manifest(tools: dict) -> str:
+    lines = [
+        "# generated by `python -m zrcl.build_manifest`, do not edit",
+        "TOOLS = {",
+    ]
+    for name, (module, attr, doc) in tools.items():
+        # json string literals are valid python ones
+        literal = ", ".join(
+            "None" if value is None else json.dumps(value)
+            for value in (module, attr, doc)
+        )
+        lines.append(f"    {json.dumps(name)}: ({literal}),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_manifest(path: str = MANIFEST_PATH, directory: str = PACKAGE_DIR):
+    content = render_manifest(scan_tools(directory))
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+if __name__ == "__main__":
+    write_manifest()
@@ -1,3 +1,6 @@
+import threading
+
+
 class SingletonClssed(type):
     """
     A metaclass that ensures only one instance of a class is created.
@@ -15,11 +18,20 @@ class SingletonClssed(type):
     """
 
     _cls = {}
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._cls:
-            cls._cls[cls] = super(SingletonClssed, cls).__call__(*args, **kwargs)
-        return cls._cls[cls]
+        ins = cls._cls.get(cls)
+        if ins is not None:
+            return ins
+
+        # double-checked, the lock is only taken until the instance exists
+        with SingletonClssed._lock:
+            ins = cls._cls.get(cls)
+            if ins is None:
+                ins = super(SingletonClssed, cls).__call__(*args, **kwargs)
+                cls._cls[cls] = ins
+        return ins
 
 
 class SingletonOne(type):
@@ -39,8 +51,14 @@ class SingletonOne(type):
     """
 
     _ins = None
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls._ins is None:
-            cls._ins = super(SingletonOne, cls).__call__(*args, **kwargs)
+        ins = cls._ins
+        if ins is not None:
+            return ins
+
+        with SingletonOne._lock:
+            if cls._ins is None:
+                cls._ins = super(SingletonOne, cls).__call__(*args, **kwargs)
         return cls._ins
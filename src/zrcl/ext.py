@@ -1,4 +1,5 @@
 import copy
+import functools
 import json
 import typing
 
@@ -30,6 +31,102 @@ class classProperty(object):
         return self
 
 
+def _get_dict(curr, key):
+    return curr.get(key)
+
+
+def _get_seq(curr, key):
+    return curr[int(key)]
+
+
+def _set_dict(curr, key, value):
+    curr[key] = value
+
+
+def _set_seq(curr, key, value):
+    curr[int(key)] = value
+
+
+def _del_dict(curr, key):
+    del curr[key]
+
+
+def _del_seq(curr, key):
+    del curr[int(key)]
+
+
+def _set_default_dict(curr, key, value, fillpadding):
+    if key not in curr:
+        curr[key] = value
+
+
+def _set_default_seq(curr, key, value, fillpadding):
+    index = int(key)
+    missing = index + 1 - len(curr)
+    if missing <= 0:
+        return
+
+    if missing > 1 and not fillpadding:
+        raise IndexError
+
+    curr.extend([None] * missing)
+    curr[index] = value
+
+
+def _set_default_set(curr, key, value, fillpadding):
+    raise IndexError("set does not support default value")
+
+
+def _set_default_attr(curr, key, value, fillpadding):
+    if not hasattr(curr, key):
+        setattr(curr, key, value)
+
+
+_GET_DISPATCH = {dict: _get_dict, list: _get_seq, set: _get_seq, tuple: _get_seq}
+_SET_DISPATCH = {dict: _set_dict, list: _set_seq, set: _set_seq, tuple: _set_seq}
+_DEL_DISPATCH = {dict: _del_dict, list: _del_seq, set: _del_seq, tuple: _del_seq}
+_SET_DEFAULT_DISPATCH = {
+    dict: _set_default_dict,
+    list: _set_default_seq,
+    tuple: _set_default_seq,
+    set: _set_default_set,
+}
+
+
+def _dispatch(table: dict, curr, default):
+    """
+    Look up the handler for type(curr), resolving subclasses through the MRO once
+    and memoizing the result in the table. Types that fall through to `default`
+    aren't memoized, so arbitrary objects can't grow the module-level tables.
+    """
+    tp = type(curr)
+    fn = table.get(tp)
+    if fn is None:
+        for base in tp.__mro__:
+            if base in table:
+                fn = table[tp] = table[base]
+                break
+        else:
+            fn = default
+    return fn
+
+
+def _walk(obj, keys):
+    curr = obj
+    lookup = _GET_DISPATCH.get
+    for key in keys:
+        tp = type(curr)
+        if tp is dict:
+            # plain dicts dominate config trees, skip the handler frame
+            curr = curr.get(key)
+        elif tp is list:
+            curr = curr[key if type(key) is int else int(key)]
+        else:
+            fn = lookup(tp) or _dispatch(_GET_DISPATCH, curr, getattr)
+            curr = fn(curr, key)
+    return curr
+
+
 def get_deep(obj: typing.Union[dict, list, set, tuple], *keys):
     """
     Get a value from a nested object using a sequence of keys.
@@ -51,16 +148,7 @@ def get_deep(obj: typing.Union[dict, list, set, tuple], *keys):
         >>> get_deep(obj, 'a', 'b', 'c')
         42
     """
-    curr = obj
-    for key in keys:
-        if isinstance(curr, dict):
-            curr = curr.get(key)
-        elif isinstance(curr, (list, set, tuple)):
-            curr = curr[int(key)]
-        else:
-            curr = getattr(curr, key)
-
-    return curr
+    return _walk(obj, keys)
 
 
 def set_deep(obj: typing.Union[dict, list, set, tuple], *keys, value):
@@ -78,21 +166,8 @@ def set_deep(obj: typing.Union[dict, list, set, tuple], *keys, value):
     Returns:
         None
     """
-    curr = obj
-    for key in keys[:-1]:
-        if isinstance(curr, dict):
-            curr = curr.get(key)
-        elif isinstance(curr, (list, set, tuple)):
-            curr = curr[int(key)]
-        else:
-            curr = getattr(curr, key)
-
-    if isinstance(curr, dict):
-        curr[keys[-1]] = value
-    elif isinstance(curr, (list, set, tuple)):
-        curr[int(keys[-1])] = value
-    else:
-        setattr(curr, keys[-1], value)
+    curr = _walk(obj, keys[:-1])
+    _dispatch(_SET_DISPATCH, curr, setattr)(curr, keys[-1], value)
 
 
 def del_deep(obj: typing.Union[dict, list, set, tuple], *keys):
@@ -106,21 +181,8 @@ def del_deep(obj: typing.Union[dict, list, set, tuple], *keys):
     Returns:
         None
     """
-    curr = obj
-    for key in keys[:-1]:
-        if isinstance(curr, dict):
-            curr = curr.get(key)
-        elif isinstance(curr, (list, set, tuple)):
-            curr = curr[int(key)]
-        else:
-            curr = getattr(curr, key)
-
-    if isinstance(curr, dict):
-        del curr[keys[-1]]
-    elif isinstance(curr, (list, set, tuple)):
-        del curr[int(keys[-1])]
-    else:
-        delattr(curr, keys[-1])
+    curr = _walk(obj, keys[:-1])
+    _dispatch(_DEL_DISPATCH, curr, delattr)(curr, keys[-1])
 
 
 def set_default_deep(
@@ -145,39 +207,10 @@ def set_default_deep(
     Returns:
         None
     """
-
-    curr = obj
-    for key in keys[:-1]:
-        if isinstance(curr, dict):
-            curr = curr.get(key)
-        elif isinstance(curr, (list, set, tuple)):
-            curr = curr[int(key)]
-        else:
-            curr = getattr(curr, key)
-
-    if isinstance(curr, set):
-        raise IndexError("set does not support default value")
-
-    # check has attr
-    if (
-        (isinstance(curr, dict) and keys[-1] in curr)
-        or (isinstance(curr, (list, set, tuple)) and int(keys[-1]) < len(curr))
-        or (not isinstance(curr, (dict, list, set, tuple)) and hasattr(curr, keys[-1]))
-    ):
-        return
-
-    if isinstance(curr, dict):
-        curr[keys[-1]] = value
-    elif isinstance(curr, (list, tuple)):
-        if len(curr) + 1 < int(keys[-1]) and not fillpadding:
-            raise IndexError
-
-        while len(curr) < int(keys[-1]):
-            curr.append(None)
-
-        curr[int(keys[-1])] = value
-    else:
-        setattr(curr, keys[-1], value)
+    curr = _walk(obj, keys[:-1])
+    _dispatch(_SET_DEFAULT_DISPATCH, curr, _set_default_attr)(
+        curr, keys[-1], value, fillpadding
+    )
 
 
 def rreplace(s: str, old: str, new: str, occurrence):
@@ -203,6 +236,10 @@ def rreplace(s: str, old: str, new: str, occurrence):
     if occurrence <= 0:
         return s
 
+    if occurrence == 1:
+        i = s.rfind(old)
+        return s if i < 0 else s[:i] + new + s[i + len(old) :]
+
     parts = s.rsplit(old, occurrence)
     return new.join(parts)
 
@@ -217,9 +254,21 @@ class FrozenDict(dict):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # frozen, so these are computed at most once
+        object.__setattr__(self, "_hash", None)
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_repr", None)
 
     def __hash__(self):
-        return hash(tuple(sorted(self.items())))
+        if self._hash is None:
+            # items form a set, so an order independent xor is enough; this
+            # also works for keys that cannot be sorted against each other
+            h = 0
+            for item in self.items():
+                h ^= hash(item)
+            # mix nonce, keeps the empty dict from hashing to 0
+            object.__setattr__(self, "_hash", h ^ 0x9E3779B97F4A7C15)
+        return self._hash
 
     def __copy__(self):
         return FrozenDict(self)
@@ -240,12 +289,17 @@ class FrozenDict(dict):
         raise AttributeError
 
     def __str__(self):
-        return str(sorted(dict(self)))
+        if self._str is None:
+            object.__setattr__(self, "_str", str(sorted(dict(self))))
+        return self._str
 
     def __repr__(self):
-        return repr(dict(self))
+        if self._repr is None:
+            object.__setattr__(self, "_repr", repr(dict(self)))
+        return self._repr
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def fromString(cls, string):
         if "{" not in string:
             return cls({"string": string})
@@ -270,6 +324,9 @@ class FrozenDict(dict):
             return json.dumps(dict(key))
 
 
+_PLAIN_VALUE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 class DictKeysDict(dict):
     """
     A dictionary where all keys are enforced to be FrozenDict instances. Any dictionary
@@ -292,6 +349,11 @@ class DictKeysDict(dict):
         super().__setitem__(key, value)
 
     def update(self, *args, **kwargs):
+        if len(args) == 1 and not kwargs and type(args[0]) is DictKeysDict:
+            # already canonical, nothing to convert
+            super().update(args[0])
+            return
+
         for k, v in dict(*args, **kwargs).items():
             k = self._ensure_frozendict(k)
             v = self._convert_value(v)
@@ -315,6 +377,8 @@ class DictKeysDict(dict):
         Raises:
             KeyError: If the key is not a valid FrozenDict or a convertible string.
         """
+        if type(key) is FrozenDict:
+            return key
         if isinstance(key, str):
             return FrozenDict.fromString(key)
         elif isinstance(key, dict) and not isinstance(key, FrozenDict):
@@ -330,6 +394,9 @@ class DictKeysDict(dict):
         Recursively convert dictionary values to DictKeysDict. If the value is a list or
         another iterable containing dictionaries, those dictionaries are also converted.
         """
+        t = type(value)
+        if t is DictKeysDict or t in _PLAIN_VALUE_TYPES:
+            return value
         if isinstance(value, dict) and not isinstance(value, DictKeysDict):
             return DictKeysDict(
                 {
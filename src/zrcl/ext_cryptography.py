@@ -1,4 +1,8 @@
 import datetime
+import os
+import queue
+import struct
+import threading
 import typing
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -11,17 +15,77 @@ from cryptography.hazmat.primitives.serialization import (
 )
 from cryptography.exceptions import InvalidSignature
 
+# immutable, shared by every sign/verify call
+_SHA256 = hashes.SHA256()
+_PSS = padding.PSS(mgf=padding.MGF1(_SHA256), salt_length=padding.PSS.MAX_LENGTH)
 
-def generate_keys():
+
+DEFAULT_KEY_SIZE = 2048
+
+# prefilled default-size keys, topped up by a daemon thread started on first use
+_KEY_POOL: "queue.Queue[rsa.RSAPrivateKey]" = queue.Queue(maxsize=4)
+_KEY_POOL_LOCK = threading.Lock()
+_KEY_POOL_THREAD = None
+
+
+def _new_private_key(key_size: int = DEFAULT_KEY_SIZE) -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+
+
+def _fill_key_pool():
+    while True:
+        _KEY_POOL.put(_new_private_key())
+
+
+def _ensure_key_pool():
+    global _KEY_POOL_THREAD
+    if _KEY_POOL_THREAD is not None:
+        return
+
+    with _KEY_POOL_LOCK:
+        if _KEY_POOL_THREAD is None:
+            _KEY_POOL_THREAD = threading.Thread(
+                target=_fill_key_pool, name="zrcl-rsa-key-pool", daemon=True
+            )
+            _KEY_POOL_THREAD.start()
+
+
+def _reset_key_pool_in_child():
+    # a forked child must not hand out the parent's pooled keys, and the filler
+    # thread doesn't exist there; start over with a fresh, empty pool (new
+    # objects, as the old ones' locks may have been held at fork time)
+    global _KEY_POOL, _KEY_POOL_LOCK, _KEY_POOL_THREAD
+    _KEY_POOL = queue.Queue(maxsize=4)
+    _KEY_POOL_LOCK = threading.Lock()
+    _KEY_POOL_THREAD = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_key_pool_in_child)
+
+
+def generate_keys(key_size: int = DEFAULT_KEY_SIZE):
     """
     Generates a pair of RSA keys - a private key and a corresponding public key.
 
+    Keys of the default size are taken from a pool that is refilled in the background,
+    so only the first call pays for the prime search.
+
+    Args:
+        key_size (int, optional): The size of the key in bits. Defaults to 2048.
+
     Returns:
         Tuple[rsa.RSAPrivateKey, rsa.RSAPublicKey]: The generated private and public keys.
     """
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=1024, backend=default_backend()
-    )
+    if key_size != DEFAULT_KEY_SIZE:
+        private_key = _new_private_key(key_size)
+    else:
+        _ensure_key_pool()
+        try:
+            private_key = _KEY_POOL.get_nowait()
+        except queue.Empty:
+            private_key = _new_private_key()
+
     public_key = private_key.public_key()
 
     return private_key, public_key
@@ -43,7 +107,7 @@ def serialize_public_key(public_key: typing.Union[rsa.RSAPublicKey, rsa.RSAPriva
     This function takes a public key as input and serializes it into a PEM-encoded byte string. If the input key is an instance of `rsa.RSAPrivateKey`, it is first converted to a public key using the `public_key()` method. The serialization is done using the `public_bytes()` method of the `rsa.RSAPublicKey` class, with the `encoding` parameter set to `serialization.Encoding.PEM` and the `format` parameter set to `serialization.PublicFormat.SubjectPublicKeyInfo`.
 
     Example usage:
-        private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024, backend=default_backend())
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
         public_key = private_key.public_key()
         serialized_public_key = serialize_public_key(public_key)
         print(serialized_public_key)
@@ -73,7 +137,7 @@ def serialize_private_key(
     This function takes a private key as input and serializes it into a PEM-encoded byte string. The serialization is done using the `private_bytes()` method of the `rsa.RSAPrivateKey` class, with the `encoding` parameter set to `serialization.Encoding.PEM`, the `format` parameter set to `serialization.PrivateFormat.PKCS8`, and the `encryption_algorithm` parameter set to `serialization.BestAvailableEncryption(encryptionPassword)`.
 
     Example usage:
-        private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024, backend=default_backend())
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
         serialized_private_key = serialize_private_key(private_key, b"my_password")
         print(serialized_private_key)
     """
@@ -204,13 +268,7 @@ def sign_data(data: bytes, private_key: rsa.RSAPrivateKey):
     Returns:
         bytes: The signature of the data.
     """
-    signature = private_key.sign(
-        data,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-        ),
-        hashes.SHA256(),
-    )
+    signature = private_key.sign(data, _PSS, _SHA256)
 
     return signature
 
@@ -228,20 +286,20 @@ def verify_signature(data: bytes, signature: bytes, public_key: rsa.RSAPublicKey
         bool: True if the signature is valid, False otherwise.
     """
     try:
-        public_key.verify(
-            signature,
-            data,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256(),
-        )
+        public_key.verify(signature, data, _PSS, _SHA256)
 
         return True
     except InvalidSignature:
         return False
 
 
+def _timestamped_payload(data: bytes, timestamp: float) -> bytes:
+    """
+    The signed layout: the timestamp as an 8-byte big-endian double, followed by the raw data.
+    """
+    return struct.pack(">d", timestamp) + data
+
+
 def sign_with_timestamp(
     data: bytes, timestamp: float = None, key: rsa.RSAPrivateKey = None
 ):
@@ -262,10 +320,7 @@ def sign_with_timestamp(
     if key is None:
         raise ValueError("No private key provided.")
 
-    concat = {"timestamp": timestamp, "data": data}
-    data = str(concat).encode()
-
-    return sign_data(data, key)
+    return sign_data(_timestamped_payload(data, timestamp), key)
 
 
 def verify_with_timestamp(
@@ -291,10 +346,7 @@ def verify_with_timestamp(
     if key is None:
         raise ValueError("No public key provided.")
 
-    concat = {"timestamp": timestamp, "data": data}
-    data = str(concat).encode()
-
-    return verify_signature(data, signature, key)
+    return verify_signature(_timestamped_payload(data, timestamp), signature, key)
 
 
 def same_privatekey(k: rsa.RSAPrivateKey, dk: rsa.RSAPrivateKey):
@@ -310,22 +362,23 @@ def same_privatekey(k: rsa.RSAPrivateKey, dk: rsa.RSAPrivateKey):
     """
     assert type(k) == type(dk)
 
-    # Extract public components from both the original and deserialized keys
-    original_public_numbers = k.public_key().public_numbers()
-    deserialized_public_numbers = dk.public_key().public_numbers()
-
-    # Compare the public components
-    assert (
-        original_public_numbers.n == deserialized_public_numbers.n
-    ), "Modulus mismatch"
-    assert (
-        original_public_numbers.e == deserialized_public_numbers.e
-    ), "Public exponent mismatch"
+    # Compare the serialized public components, one memcmp instead of big-int rebuilds
+    assert k.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    ) == dk.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    ), "Public key mismatch"
 
     # If the keys include private components, compare those too
     if isinstance(k, rsa.RSAPrivateKey) and isinstance(dk, rsa.RSAPrivateKey):
-        assert (
-            k.private_numbers().d == dk.private_numbers().d
-        ), "Private exponent mismatch"
-        assert k.private_numbers().p == dk.private_numbers().p, "Prime 1 mismatch"
-        assert k.private_numbers().q == dk.private_numbers().q, "Prime 2 mismatch"
+        assert k.private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ) == dk.private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ), "Private key mismatch"
+
+    return True
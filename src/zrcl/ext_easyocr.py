@@ -2,6 +2,26 @@ import typing
 import io
 import numpy
 import easyocr
+from PIL import Image
+
+_READERS: typing.Dict[typing.FrozenSet[str], easyocr.Reader] = {}
+
+
+def get_reader(lang: typing.List[str] = ["en"]) -> easyocr.Reader:
+    """
+    Returns an EasyOCR reader for the given languages, loading the models only once.
+
+    Args:
+        lang (typing.List[str], optional): The list of languages to recognize. Defaults to ["en"].
+
+    Returns:
+        easyocr.Reader: The cached reader.
+    """
+    key = frozenset(lang)
+    reader = _READERS.get(key)
+    if reader is None:
+        reader = _READERS[key] = easyocr.Reader(lang_list=list(lang))
+    return reader
 
 
 def get_text_coords(
@@ -33,12 +53,50 @@ def get_text_coords(
         >>> print(coords)
         [(bottom_left_coords, top_right_coords, confidence, text), ...]
     """
-    reader = easyocr.Reader(lang_list=lang)
+    reader = get_reader(lang)
+    result = reader.readtext(_resolve_image(image), **additionalReaderArgs)
+    return _to_coords(result)
 
+
+def get_text_coords_batch(
+    images: typing.List[typing.Union[str, bytes, numpy.ndarray, io.BytesIO]],
+    lang: typing.List[str] = ["en"],
+    additionalReaderArgs: typing.Dict = {},
+    batch_size: int = 8,
+):
+    """
+    Extracts the coordinates of text in several images with a single batched EasyOCR call.
+
+    Args:
+        images (typing.List[typing.Union[str, bytes, numpy.ndarray, io.BytesIO]]): The input images. Unless
+            `n_width` and `n_height` are passed in additionalReaderArgs, they must all have the same size.
+        lang (typing.List[str], optional): The list of languages to recognize. Defaults to ["en"].
+        additionalReaderArgs (typing.Dict, optional): Additional arguments to pass to `Reader.readtext_batched`.
+            Defaults to {}.
+        batch_size (int, optional): The number of images the recognizer processes per batch. Defaults to 8.
+
+    Returns:
+        List[List[Tuple[Tuple[int, int], Tuple[int, int], float, str]]]: One list per input image, in the same
+            format as `get_text_coords`.
+    """
+    reader = get_reader(lang)
+    results = reader.readtext_batched(
+        [_resolve_image(image) for image in images],
+        batch_size=batch_size,
+        **additionalReaderArgs,
+    )
+    return [_to_coords(result) for result in results]
+
+
+def _resolve_image(image):
     if isinstance(image, io.BytesIO):
-        image = numpy.array(image)
+        return numpy.array(Image.open(image))
+    if isinstance(image, Image.Image):
+        return numpy.array(image)
+    return image
+
 
-    result = reader.readtext(image, **additionalReaderArgs)
+def _to_coords(result):
     coordinates = []
     for detection in result:
         bottom_left = detection[0][0]
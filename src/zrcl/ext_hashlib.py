@@ -1,31 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import mmap
 import os
+import typing
 from zrcl.ext_re import should_include
 
+CHUNK_SIZE = 1 << 20
+MMAP_THRESHOLD = 1 << 20
+# not available on Windows
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+
+
+def _update_span(hasher, source, view, start: int, end: int, pending_cr: bool):
+    """
+    Feeds source[start:end] into the hasher with CRLF pairs folded to LF.
+
+    `source` is anything with a bytes-like find (bytearray, mmap) and `view` a memoryview
+    over it. Spans without any CR are hashed without being copied. Returns whether the
+    span ended in a CR that has to be carried into the next one.
+    """
+    if pending_cr:
+        # resolve the carried CR against the first byte, without re-concatenating
+        if view[start] == 0x0A:
+            hasher.update(b"\n")
+            start += 1
+        else:
+            hasher.update(b"\r")
+
+    if source.find(b"\r", start, end) == -1:
+        hasher.update(view[start:end])
+        return False
+
+    pending_cr = view[end - 1] == 0x0D
+    if pending_cr:
+        end -= 1
+    # one slice plus one replace, both in C
+    hasher.update(source[start:end].replace(b"\r\n", b"\n"))
+    return pending_cr
+
+
+def _update_from_file(hasher, f, chunk_size: int, normalize_newline: bool):
+    """
+    Feeds an open binary file into the hasher, reusing a single read buffer.
+
+    With normalize_newline, CRLF pairs are folded to LF, including pairs split across
+    two chunks.
+    """
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    pending_cr = False
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        if not normalize_newline:
+            hasher.update(view[:n])
+            continue
+        pending_cr = _update_span(hasher, buf, view, 0, n, pending_cr)
+
+    if pending_cr:
+        hasher.update(b"\r")
+
+
+def _update_from_mmap(hasher, f, size: int, chunk_size: int, normalize_newline: bool):
+    """
+    Feeds an open binary file into the hasher straight from the page cache.
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if _MADV_SEQUENTIAL is not None:
+            # one front-to-back pass, so ask for aggressive readahead
+            mm.madvise(_MADV_SEQUENTIAL)
+
+        if not normalize_newline:
+            hasher.update(mm)
+            return
+
+        pending_cr = False
+        with memoryview(mm) as view:
+            for start in range(0, size, chunk_size):
+                end = min(start + chunk_size, size)
+                pending_cr = _update_span(hasher, mm, view, start, end, pending_cr)
+
+    if pending_cr:
+        hasher.update(b"\r")
+
 
 def hash_file(
     path: str,
     algorithm: str = "sha256",
-    chunk_size: int = 65536,
+    chunk_size: int = CHUNK_SIZE,
     normalize_newline: bool = True,
 ) -> str:
     """
     Computes the hash value of a file.
 
+    Files of at least MMAP_THRESHOLD bytes are memory mapped rather than read.
+
     Args:
         path (str): The path to the file.
         algorithm (str): The hashing algorithm to use. Defaults to "sha256".
-        chunk_size (int): The size of the chunks used to read the file. Defaults to 65536.
+        chunk_size (int): The size of the chunks used to read the file. Defaults to 1 MiB.
 
     Returns:
         str: The computed hash value of the file.
     """
-    hasher = hashlib.new(algorithm)
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            if normalize_newline:
-                chunk = chunk.replace(b"\r\n", b"\n")
-            hasher.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            hasher = hashlib.new(algorithm)
+            _update_from_mmap(hasher, f, size, chunk_size, normalize_newline)
+            return hasher.hexdigest()
+
+        if not normalize_newline and hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        hasher = hashlib.new(algorithm)
+        _update_from_file(hasher, f, chunk_size, normalize_newline)
+    return hasher.hexdigest()
+
+
+def _iter_files(
+    root: str,
+    is_wanted: typing.Callable[[str], bool],
+    is_wanted_dir: typing.Callable[[str], bool] = None,
+) -> typing.Iterator[str]:
+    """
+    Yields the paths of wanted files below root, walking with os.scandir.
+
+    File and directory checks use the type cached on each DirEntry, so no extra stat is
+    needed. Symlinked directories are not followed, matching os.walk.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if is_wanted_dir is None or is_wanted_dir(entry.name):
+                        stack.append(entry.path)
+                elif entry.is_file() and is_wanted(entry.name):
+                    yield entry.path
+
+
+def _hash_files(
+    paths: typing.Iterable[str],
+    algorithm: str,
+    chunk_size: int,
+    normalize_newline: bool,
+) -> str:
+    """
+    Hashes the files concurrently and folds their digests, in sorted path order, into
+    one digest.
+    """
+    paths = sorted(paths)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        digests = pool.map(
+            lambda p: hash_file(p, algorithm, chunk_size, normalize_newline), paths
+        )
+        hasher = hashlib.new(algorithm)
+        for digest in digests:
+            hasher.update(digest.encode())
     return hasher.hexdigest()
 
 
@@ -52,7 +185,7 @@ def hash_bytes(
 def hash_folder(
     path: str,
     algorithm: str = "sha256",
-    chunk_size: int = 65536,
+    chunk_size: int = CHUNK_SIZE,
     include_file_masks: list = [],
     exclude_file_masks: list = [],
     normalize_newline: bool = True,
@@ -63,30 +196,27 @@ def hash_folder(
     Args:
         path (str): The path to the folder.
         algorithm (str): The hashing algorithm to use. Defaults to "sha256".
-        chunk_size (int): The size of the chunks used to read the files. Defaults to 65536.
+        chunk_size (int): The size of the chunks used to read the files. Defaults to 1 MiB.
         include_file_masks (list): A list of file masks to include. Defaults to an empty list.
         exclude_file_masks (list): A list of file masks to exclude. Defaults to an empty list.
         normalize_newline (bool): Whether to normalize newline characters. Defaults to True.
     Returns:
         str: The computed hash value of all the files in the folder.
+
+    Files are hashed concurrently; the result is the hash of the per-file digests
+    in sorted path order.
     """
-    hasher = hashlib.new(algorithm)
-    for root, dirs, files in os.walk(path):
-        for file in files:
-            if not should_include(file, include_file_masks, exclude_file_masks):
-                continue
-            with open(os.path.join(root, file), "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    if normalize_newline:
-                        chunk = chunk.replace(b"\r\n", b"\n")
-                    hasher.update(chunk)
-    return hasher.hexdigest()
+    paths = _iter_files(
+        path,
+        lambda name: should_include(name, include_file_masks, exclude_file_masks),
+    )
+    return _hash_files(paths, algorithm, chunk_size, normalize_newline)
 
 
 def hash_python_directory(
     directory: str,
     algorithm: str = "sha256",
-    chunk_size: int = 65536,
+    chunk_size: int = CHUNK_SIZE,
     normalize_newline: bool = True,
 ) -> str:
     """
@@ -96,23 +226,17 @@ def hash_python_directory(
     Args:
         directory (str): The directory to be hashed.
         algorithm (str, optional): The hashing algorithm to use. Defaults to 'sha256'.
-        chunk_size (int): The size of the chunks used to read the files. Defaults to 65536.
+        chunk_size (int): The size of the chunks used to read the files. Defaults to 1 MiB.
 
     Returns:
         str: The computed hash value of the directory contents in hexadecimal format.
+
+    Files are hashed concurrently; the result is the hash of the per-file digests
+    in sorted path order.
     """
-    hasher = hashlib.new(algorithm)
-    for root, dirs, files in os.walk(directory):
-        dirs[:] = [
-            d for d in dirs if d != "__pycache__"
-        ]  # Skip '__pycache__' directories
-        for file in files:
-            if not file.endswith(".py"):
-                continue  # Only hash Python files
-            file_path = os.path.join(root, file)
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    if normalize_newline:
-                        chunk = chunk.replace(b"\r\n", b"\n")
-                    hasher.update(chunk)
-    return hasher.hexdigest()
+    paths = _iter_files(
+        directory,
+        lambda name: name.endswith(".py"),  # Only hash Python files
+        lambda name: name != "__pycache__",  # Skip '__pycache__' directories
+    )
+    return _hash_files(paths, algorithm, chunk_size, normalize_newline)
@@ -6,8 +6,10 @@ def read_json(file: str):
     """
     simple json reader
     """
-    with open(file) as f:
-        return json.load(f)
+    # read raw bytes in one call; json.loads detects the utf-8/16/32 encoding
+    # itself, which skips the line-by-line text decoder
+    with open(file, "rb") as f:
+        return json.loads(f.read())
 
 
 def write_json(file: str, data):
@@ -1,7 +1,80 @@
+import json
 import os
+import random
+import subprocess
+import typing
+import numpy
 from PIL import Image
 from zrcl.ext_pillow import is_mono_color
-from zrcl.ext_random import weighted_choice
+
+MAX_THUMBNAIL_ATTEMPTS = 10
+# how far before the end a seek is allowed when the frame rate is unknown
+FALLBACK_END_MARGIN = 0.1
+
+
+def _probe_video(video_path: str):
+    """
+    Returns the (width, height, duration, fps) of the first video stream using
+    ffprobe; fps is None when the stream doesn't report a usable rate.
+    """
+    proc = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=width,height,avg_frame_rate:format=duration",
+            "-of",
+            "json",
+            video_path,
+        ],
+        capture_output=True,
+        check=True,
+    )
+    info = json.loads(proc.stdout)
+    stream = info["streams"][0]
+    num, _, den = stream.get("avg_frame_rate", "0/0").partition("/")
+    fps = float(num) / float(den) if den and float(den) and float(num) else None
+    return stream["width"], stream["height"], float(info["format"]["duration"]), fps
+
+
+def _grab_frame(
+    video_path: str, t: float, width: int, height: int
+) -> typing.Optional[numpy.ndarray]:
+    """
+    Decodes the single frame at `t` seconds with ffmpeg, seeking on the input.
+    Returns None when ffmpeg decodes nothing there (e.g. a seek past the last frame).
+    """
+    proc = subprocess.run(
+        [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-ss",
+            str(t),
+            "-i",
+            video_path,
+            "-frames:v",
+            "1",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "pipe:",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    if not proc.stdout:
+        return None
+
+    frame = numpy.frombuffer(proc.stdout, dtype=numpy.uint8)
+    if frame.size != width * height * 3:
+        # ffmpeg applies rotation metadata, which swaps the probed dimensions
+        width, height = height, width
+    return frame.reshape(height, width, 3)
 
 
 def make_thumbnail(video_path: str, sec: int = None, avoid_single_color: bool = True):
@@ -17,33 +90,37 @@ def make_thumbnail(video_path: str, sec: int = None, avoid_single_color: bool =
         Image: The generated thumbnail image.
 
     Raises:
-        None
+        subprocess.CalledProcessError: If ffprobe or ffmpeg fails on the file.
+        ValueError: If no attempt decoded a frame.
 
     Notes:
-        - This function uses the `moviepy` library to generate the thumbnail image.
+        - This function calls `ffprobe` and `ffmpeg` directly (they must be on PATH), seeking straight to each candidate frame.
         - The `sec` argument is used to specify the timestamp at which to generate the thumbnail. If not provided, a random timestamp will be chosen.
-        - The `avoid_single_color` argument determines whether to avoid generating thumbnails with a single color. If set to True, the function will keep generating thumbnails until a non-single-color image is found.
+        - The `avoid_single_color` argument determines whether to avoid generating thumbnails with a single color. If set to True, the function will try up to `MAX_THUMBNAIL_ATTEMPTS` random timestamps until a non-single-color image is found, returning the last frame otherwise.
         - The function returns an `Image` object representing the generated thumbnail.
     """
-    from moviepy.editor import VideoFileClip
-
-    sec = weighted_choice(sumk=2)
-    while True:
-        clip = VideoFileClip(video_path)
-
-        sec = weighted_choice(sumk=2) + sec
-
-        sec = min(sec, clip.duration)
-        frame = clip.get_frame(sec)
+    width, height, duration, fps = _probe_video(video_path)
+    # the last frame starts one frame before the end; seeking past that
+    # decodes nothing
+    last_t = max(0.0, duration - (1 / fps if fps else FALLBACK_END_MARGIN))
+
+    image = None
+    t = min(sec, last_t) if sec is not None else None
+    for _ in range(MAX_THUMBNAIL_ATTEMPTS):
+        if t is None:
+            t = random.uniform(0, last_t)
+
+        frame = _grab_frame(video_path, t, width, height)
+        t = None
+        if frame is None:
+            continue
 
         image = Image.fromarray(frame)
-
-        if not avoid_single_color:
-            break
-
-        if not is_mono_color(image):
+        if not avoid_single_color or not is_mono_color(image):
             break
 
+    if image is None:
+        raise ValueError(f"No frame could be decoded from {video_path}")
     return image
 
 
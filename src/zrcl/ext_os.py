@@ -1,8 +1,8 @@
 import os
-import stat
+import sys
 
 
-def has_hidden_attribute(filepath):
+def _has_hidden_attribute_win32(filepath):
     """
     Check if a file has the hidden attribute.
 
@@ -12,4 +12,33 @@ def has_hidden_attribute(filepath):
     Returns:
         bool: True if the file has the hidden attribute, False otherwise.
     """
-    return bool(os.stat(filepath).st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+    attrs = _GetFileAttributesW(os.fspath(filepath))
+    return attrs != _INVALID_FILE_ATTRIBUTES and bool(attrs & _FILE_ATTRIBUTE_HIDDEN)
+
+
+def _has_hidden_attribute_posix(filepath):
+    """
+    Check if a file is hidden, i.e. its name starts with a dot.
+
+    Parameters:
+        filepath (str): The path to the file.
+
+    Returns:
+        bool: True if the file is hidden, False otherwise.
+    """
+    name = os.path.basename(os.path.normpath(filepath))
+    return name.startswith(".") and name not in (".", "..")
+
+
+if sys.platform == "win32":
+    import ctypes
+
+    _FILE_ATTRIBUTE_HIDDEN = 0x2
+    _INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+
+    has_hidden_attribute = _has_hidden_attribute_win32
+else:
+    has_hidden_attribute = _has_hidden_attribute_posix
@@ -11,11 +11,16 @@ def is_mono_color(image: Image.Image):
     Returns:
         True if all pixels are the same color, False otherwise.
     """
+    # most images differ somewhere among a few spread out samples, reject those in O(1)
+    w, h = image.size
     first_pixel = image.getpixel((0, 0))
+    for xy in ((w - 1, h - 1), (w - 1, 0), (0, h - 1), (w // 2, h // 2)):
+        if image.getpixel(xy) != first_pixel:
+            return False
 
-    # Check if all pixels are the same as the first pixel
-    for x in range(image.width):
-        for y in range(image.height):
-            if image.getpixel((x, y)) != first_pixel:
-                return False
-    return True
+    # per band (min, max), computed in C without copying the pixel data
+    extrema = image.getextrema()
+    if not isinstance(extrema[0], tuple):
+        extrema = (extrema,)
+
+    return all(lo == hi for lo, hi in extrema)
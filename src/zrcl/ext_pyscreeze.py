@@ -15,7 +15,7 @@ class PyscreezeImports:
     )
 
 
-def boxcenter(box):
+def boxcenter(box, _Point=pyscreeze.Point):
     """
     Calculate the center coordinates of the given box.
 
@@ -27,9 +27,12 @@ def boxcenter(box):
         Point
             The center coordinates of the box as a Point object.
     """
-    if isinstance(box, tuple):
-        return pyscreeze.center(box)
-    return pyscreeze.Point(box.left + box.width / 2, box.top + box.height / 2)
+    try:
+        left, top, width, height = box
+    except (TypeError, ValueError):
+        return _Point(box.left + box.width * 0.5, box.top + box.height * 0.5)
+    # same truncation as pyscreeze.center
+    return _Point(left + int(width * 0.5), top + int(height * 0.5))
 
 
 try:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import random
 
 HALVED_WEIGHTS = {
@@ -10,13 +11,78 @@ HALVED_WEIGHTS = {
 }
 
 
+class _AliasTable:
+    """
+    Vose alias table: each draw costs one bucket roll and one coin flip,
+    independent of the number of choices. Draws come from the `random` module,
+    so `random.seed()` keeps them reproducible.
+    """
+
+    def __init__(self, choices):
+        self.keys = list(choices.keys())
+        n = len(self.keys)
+        weights = list(choices.values())
+
+        # Normalize the probabilities so they average to 1 per bucket
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+
+        # whatever is left is 1 up to rounding error
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self):
+        bucket = random.randrange(len(self.keys))
+        if random.random() < self.prob[bucket]:
+            return self.keys[bucket]
+        return self.keys[self.alias[bucket]]
+
+
+@lru_cache(maxsize=64)
+def _alias_table(items):
+    return _AliasTable(dict(items))
+
+
+def _halved_draw():
+    # HALVED_WEIGHTS is p(i) = 2^-(i+1) over 0..5, renormalized; the trailing
+    # zero count of 6 random bits has exactly that shape, and rejecting the
+    # all-zero roll supplies the renormalization
+    bits = 0
+    while not bits:
+        bits = random.getrandbits(6)
+    return (bits & -bits).bit_length() - 1
+
+
 def weighted_choice(choices=HALVED_WEIGHTS, sumk=1):
-    values = list(choices.keys())
-    probabilities = list(choices.values())
+    """
+    Draws `sumk` weighted samples from the keys of `choices` and returns their sum.
+
+    Args:
+        choices (dict, optional): A mapping of value to (unnormalized) weight. Defaults to HALVED_WEIGHTS.
+        sumk (int, optional): The number of samples to draw and sum. Defaults to 1.
+
+    Returns:
+        The drawn key when sumk is 1, otherwise the sum of the drawn keys.
+    """
+    if choices is HALVED_WEIGHTS:
+        if sumk <= 1:
+            return _halved_draw()
+        return sum(_halved_draw() for _ in range(sumk))
 
-    # Normalize the probabilities to sum to 1
-    total = sum(probabilities)
-    normalized_probabilities = [p / total for p in probabilities]
+    table = _alias_table(tuple(choices.items()))
 
-    res = random.choices(values, normalized_probabilities, k=1)[0]
-    return res + weighted_choice(choices, sumk - 1) if sumk > 1 else res
+    if sumk <= 1:
+        return table.sample()
+    return sum(table.sample() for _ in range(sumk))
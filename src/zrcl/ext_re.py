@@ -1,36 +1,29 @@
 from functools import lru_cache
+import fnmatch
 import re
 
 
-@lru_cache()
+@lru_cache(maxsize=512)
 def compile_pattern(pattern):
-    if "*." in pattern:  # Pattern like '*.txt'
-        ext = pattern.split("*.")[-1]
-        return re.compile(r".*\." + re.escape(ext) + r"$")
-    if "*" in pattern:  # Generic wildcard patterns like 'temp_*'
-        return re.compile(re.escape(pattern).replace(r"\*", ".*"))
-    return re.compile(
-        re.escape(pattern) + r"$"
-    )  # For exact filename or simple patterns
+    return re.compile(fnmatch.translate(pattern))
+
+
+@lru_cache(maxsize=512)
+def _combined_pattern(patterns):
+    # one alternation per mask list, so a file name costs a single match call;
+    # fnmatch.translate output is self-anchored, so the pieces join as-is
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
 
 
 def should_include(file_name, include_file_masks=[], exclude_file_masks=[]):
-    # Compile patterns only once
-    includes = [compile_pattern(pattern) for pattern in include_file_masks]
-    excludes = [compile_pattern(pattern) for pattern in exclude_file_masks]
+    includes = _combined_pattern(tuple(include_file_masks))
+    excludes = _combined_pattern(tuple(exclude_file_masks))
 
     # Check excludes first
-    for pattern in excludes:
-        if pattern.match(file_name):
-            return False
+    if excludes is not None and excludes.match(file_name):
+        return False
 
     # If includes is empty, return True unless excluded
-    if not includes:
-        return True
-
-    # Check includes
-    for pattern in includes:
-        if pattern.match(file_name):
-            return True
-
-    return False
+    return includes is None or includes.match(file_name) is not None
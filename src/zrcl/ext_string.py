@@ -1,5 +1,22 @@
+from functools import lru_cache
+import re
 from string import Formatter
 
+_FORMATTER = Formatter()
+
+# escaped braces, a plain replacement field, or a brace the simple form can't
+# account for (nested specs, bad conversions, unbalanced braces, and indexed
+# field names, whose brackets may hide ":" / "!" or be left unclosed)
+_FIELD_RE = re.compile(r"\{\{|\}\}|\{([^{}!:\[\]]*)(?:![rsa])?(?::[^{}]*)?\}|[{}]")
+
+
+@lru_cache(maxsize=4096)
+def _parse_fstring(string: str):
+    try:
+        return tuple(_FORMATTER.parse(string))
+    except ValueError:
+        return None
+
 
 def is_fstring(string: str):
     """
@@ -13,11 +30,9 @@ def is_fstring(string: str):
     """
     if not isinstance(string, str):
         return False
-    try:
-        Formatter().parse(string)
+    if "{" not in string and "}" not in string:
         return True
-    except ValueError:
-        return False
+    return _parse_fstring(string) is not None
 
 
 def extract_fstring_keys(string: str):
@@ -42,7 +57,12 @@ def extract_fstring_keys(string: str):
     """
     if not isinstance(string, str):
         return []
-    try:
-        return [x[1] for x in Formatter().parse(string) if x[1] is not None]
-    except ValueError:
-        return []
+
+    keys = []
+    for match in _FIELD_RE.finditer(string):
+        if match.lastindex:
+            keys.append(match.group(1))
+        elif len(match.group()) == 1:
+            # leave anything unusual to the real parser
+            return [x[1] for x in _parse_fstring(string) or () if x[1] is not None]
+    return keys
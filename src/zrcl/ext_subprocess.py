@@ -1,7 +1,9 @@
+import asyncio
+from functools import lru_cache
+import shutil
 import subprocess
 from typing import TypedDict
 import typing
-import platform
 
 
 def open_detached(path: str, *args) -> None:
@@ -91,15 +93,54 @@ def query(path: str, *args, timeout: int = 5, ctx: queryCtx = None) -> bytes:
     except subprocess.CalledProcessError as e:
         raise e
 
+    return _process_output(proc.stdout, ctx)
+
+
+async def query_async(
+    path: str, *args, timeout: int = 5, ctx: queryCtx = None
+) -> bytes:
+    """
+    Awaitable counterpart of `query` that runs the subprocess without blocking the event loop.
+
+    Args:
+        path (str): The path to the executable file.
+        *args: Additional arguments to be passed to the executable.
+        timeout (int, optional): The maximum amount of time to wait for the subprocess to complete. Defaults to 5.
+        ctx (queryCtx, optional): Additional context for processing the subprocess output. Defaults to None.
+
+    Returns:
+        bytes: The output of the subprocess, post-processed the same way as `query`.
+
+    Raises:
+        subprocess.TimeoutExpired: If the subprocess takes longer than the specified timeout to complete.
+    """
+    command = [path, *(str(arg) for arg in args)]
+    proc = await asyncio.create_subprocess_exec(
+        *command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(command, timeout)
+
+    return _process_output(stdout, ctx)
+
+
+_BLANK_LINES = frozenset((" ", "\t", "\n", "\r", "\x00", "\r\n", ""))
+
+
+def _process_output(stdout: bytes, ctx: queryCtx = None):
     if ctx is None:
-        return proc.stdout
+        return stdout
 
     if "decode" in ctx:
-        decoded = proc.stdout.decode(ctx["decode"])
+        decoded = stdout.decode(ctx["decode"])
     elif "decodeOrder" in ctx:
         for decode in ctx["decodeOrder"]:
             try:
-                decoded = proc.stdout.decode(decode)
+                decoded = stdout.decode(decode)
                 break
             except UnicodeDecodeError:
                 pass
@@ -110,18 +151,15 @@ def query(path: str, *args, timeout: int = 5, ctx: queryCtx = None) -> bytes:
         return decoded
 
     if "stripNull" in ctx and ctx["stripNull"]:
-        decodedList = list(filter(lambda x: x != "", decodedList))
+        decodedList = [x for x in decodedList if x]
 
     if "stripEmpty" in ctx and ctx["stripEmpty"]:
-        blist = decodedList
-        decodedList = []
-        for b in blist:
-            if b not in [" ", "\t", "\n", "\r", "\x00", "\r\n", ""]:
-                decodedList.append(b.strip())
+        decodedList = [b.strip() for b in decodedList if b not in _BLANK_LINES]
 
     return decodedList
 
 
+@lru_cache(maxsize=256)
 def check_is_installed(app_name: str) -> bool:
     """
     Check if an application is installed on the operating system.
@@ -132,51 +170,9 @@ def check_is_installed(app_name: str) -> bool:
     Returns:
         bool: True if the application is installed, False otherwise.
 
-    This function checks if an application is installed on the operating system by using the appropriate command for the operating system.
-
-    On Windows, it uses the 'where' command to check for the app existence.
-
-    On macOS, it uses the 'type' command or 'which' command to check for the app existence.
-
-    On Linux, it uses the 'which' command to check for the app existence.
-
-    If the command succeeds, the application is considered installed and the function returns True.
-
-    If the command fails, the application is considered not installed and the function returns False.
-
-    If the operating system is not Windows, macOS, or Linux, the function returns False.
+    The lookup scans PATH with `shutil.which` (honouring PATHEXT on Windows)
+    rather than spawning `where`/`which`. Results are cached for the life of
+    the process; call `check_is_installed.cache_clear()` after installing
+    something mid-run.
     """
-
-    os_type = platform.system()
-
-    try:
-        if os_type == "Windows":
-            # On Windows, use 'where' command to check for the app existence
-            subprocess.check_call(
-                ["where", app_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        elif os_type == "Darwin":
-            # On macOS, use 'type' command or 'which'
-            subprocess.check_call(
-                ["type", app_name],
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        elif os_type == "Linux":
-            # On Linux, use 'which' command
-            subprocess.check_call(
-                ["which", app_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        else:
-            return False
-    except subprocess.CalledProcessError:
-        # The command failed, the application is not installed
-        return False
-
-    # The command succeeded, the application is installed
-    return True
+    return shutil.which(app_name) is not None
@@ -1,50 +1,96 @@
+from collections import OrderedDict
 import time
+import weakref
+
+# instances that can't be weakly referenced (or hashed) are cached by id in a
+# bounded LRU instead
+FALLBACK_CACHE_SIZE = 256
+
+
+class _TimelyCache:
+    def __init__(self):
+        self.weak = weakref.WeakKeyDictionary()
+        self.fallback = OrderedDict()
+
+    def get(self, key):
+        try:
+            return self.weak.get(key)
+        except TypeError:
+            pinned = self.fallback.get(id(key))
+            if pinned is None or pinned[0] is not key:
+                return None
+            self.fallback.move_to_end(id(key))
+            return pinned[1]
+
+    def set(self, key, entry):
+        try:
+            self.weak[key] = entry
+        except TypeError:
+            # keep the key alive alongside the entry so a reused id can't match
+            self.fallback[id(key)] = (key, entry)
+            self.fallback.move_to_end(id(key))
+            if len(self.fallback) > FALLBACK_CACHE_SIZE:
+                self.fallback.popitem(last=False)
+
+    def pop(self, key):
+        try:
+            self.weak.pop(key, None)
+        except TypeError:
+            pinned = self.fallback.get(id(key))
+            if pinned is not None and pinned[0] is key:
+                del self.fallback[id(key)]
 
 
 class timelyProperty:
     def __init__(self, func, ttl=10):
         self.func = func
         self.ttl = ttl
-        self.cache = {}
+        self.cache = _TimelyCache()
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        current_time = time.time()
-        cache_entry = self.cache.get(instance)
+        current_time = time.monotonic()
+        # hit the weak table directly; only unreferenceable keys take the slow path
+        try:
+            cache_entry = self.cache.weak.get(instance)
+        except TypeError:
+            cache_entry = self.cache.get(instance)
 
-        if cache_entry and (current_time < cache_entry["expire_time"]):
-            return cache_entry["value"]
+        if cache_entry is not None and current_time < cache_entry[1]:
+            return cache_entry[0]
 
         # Cache is expired or not set, recalculate and update
         value = self.func(instance)
-        self.cache[instance] = {"value": value, "expire_time": current_time + self.ttl}
+        self.cache.set(instance, (value, current_time + self.ttl))
         return value
 
     def __delete__(self, instance):
-        if instance in self.cache:
-            del self.cache[instance]
+        self.cache.pop(instance)
 
 
 class timelyClsProperty:
     def __init__(self, func, ttl=10):  # Default TTL is set to 10 seconds
         self.func = func
         self.ttl = ttl
-        self.cache = {}
+        self.cache = _TimelyCache()
 
     def __get__(self, instance, owner):
-        current_time = time.time()
-        cache_entry = self.cache.get(owner)
+        current_time = time.monotonic()
+        # hit the weak table directly; only unreferenceable keys take the slow path
+        try:
+            cache_entry = self.cache.weak.get(owner)
+        except TypeError:
+            cache_entry = self.cache.get(owner)
 
-        if cache_entry and (current_time < cache_entry["expire_time"]):
-            return cache_entry["value"]
+        if cache_entry is not None and current_time < cache_entry[1]:
+            return cache_entry[0]
 
         # Cache is expired or not set, recalculate and update
         value = self.func(owner)
-        self.cache[owner] = {"value": value, "expire_time": current_time + self.ttl}
+        self.cache.set(owner, (value, current_time + self.ttl))
         return value
 
     def __delete__(self, owner):
-        if owner in self.cache:
-            del self.cache[owner]
+        self.cache.pop(owner)
@@ -1,16 +1,50 @@
-from functools import cache, cached_property
+import copy
+import io
+from functools import cached_property, lru_cache
 import os
 from types import MappingProxyType
 import typing
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 _global_counter = 0
 
+# indentation strings for the normalized document, which always uses 4 spaces
+_PAD = tuple(" " * (4 * i) for i in range(256))
+
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _plain_copy(obj):
+    # yaml.safe_load output is almost entirely dicts, lists and scalars; copy
+    # those directly and leave anything else (dates, sets...) to deepcopy
+    cls = type(obj)
+    if cls is dict:
+        return {k: _plain_copy(v) for k, v in obj.items()}
+    if cls is list:
+        return [_plain_copy(v) for v in obj]
+    if cls in _ATOMIC_TYPES:
+        return obj
+    return copy.deepcopy(obj)
+
 
 class _FloYaml__Val:
+    __slots__ = ("key",)
+
     def __init__(self, key):
         self.key = key
 
+    # compare by key so equal VAL(...) markers share lookup cache entries
+    def __eq__(self, other):
+        return type(other) is type(self) and other.key == self.key
+
+    def __hash__(self):
+        return hash((_FloYaml__Val, self.key))
+
     def __getitem__(self, val):
         return self.__class__(val)
 
@@ -21,6 +55,27 @@ class _FloYaml__Val:
 VAL = _FloYaml__Val("")
 
 
+@lru_cache(maxsize=1024)
+def _parse_keys(keys: tuple):
+    """
+    Split a key sequence into (key, index, duplicate prefix, is VAL) steps once,
+    so repeated lookups skip the per-key string handling.
+    """
+    parsed = []
+    for key in keys:
+        is_val = isinstance(key, _FloYaml__Val)
+        if is_val:
+            key = key.key
+
+        index = None
+        if "[" in key and "]" in key:
+            key, index = key.split("[")
+            index = int(index.rstrip("]"))
+
+        parsed.append((key, index, f"{key}_floyaml_", is_val))
+    return tuple(parsed)
+
+
 class FloYaml:
     VAL = VAL
 
@@ -33,10 +88,9 @@ class FloYaml:
     @cached_property
     def __baseindent(self):
         for line in self.__rawstr.split("\n"):
-            if len(line) == len(line.lstrip()):
-                continue
-
-            return len(line) - len(line.lstrip())
+            indent = len(line) - len(line.lstrip())
+            if indent:
+                return indent
 
     def __init__(self, data: str):
         if "_floyaml_" in data:
@@ -46,8 +100,10 @@ class FloYaml:
 
         parsed_block = self.__process(data)
         self.__lines = self.__partition(parsed_block)
-        formatted = [i * 4 * " " + line for i, line in self.__lines]
-        self.__datadict = yaml.safe_load("\n".join(formatted))
+        formatted = [
+            (_PAD[i] if i < 256 else " " * 4 * i) + line for i, line in self.__lines
+        ]
+        self.__datadict = yaml.load("\n".join(formatted), Loader=_SafeLoader)
 
     def __process(self, raw_string: str):
         """
@@ -66,17 +122,20 @@ class FloYaml:
         formatted_lines = []
 
         # Parse lines to extract indentation and strip unnecessary whitespaces
-        base_extracted = [
-            ((len(line) - len(line.lstrip())) // self.__baseindent, line.strip())
-            for line in lines
-            if line.strip()
-        ]
+        base_extracted = []
+        for line in lines:
+            content = line.lstrip()
+            if not content:
+                continue
+            indent = (len(line) - len(content)) // self.__baseindent
+            base_extracted.append((indent, content.rstrip()))
 
         for i in range(len(base_extracted)):
             indent, line = base_extracted[i]
 
             if ":" not in line:
                 formatted_lines.append((indent, line))
+                continue
 
             key, val = line.split(":", 1)
             key = key.strip()
@@ -133,20 +192,22 @@ class FloYaml:
         then its path will be saved in an registry
 
         """
-        stack = []  # Stack to maintain current scope and path
+        # Stack to maintain current scope as (indent, key, dotted path to key)
+        stack = []
         path_registry = {}  # Registry to store paths and track all keys
         output = []  # Output list with possibly renamed lines
 
         for indent, line in lines:
             # Get the current key (ignore values for now)
-            key = line.split(":")[0].strip() if ":" in line else line.strip()
+            key = line.split(":", 1)[0].strip()
 
             # Manage the stack based on current indentation
             while stack and stack[-1][0] >= indent:
                 stack.pop()
 
-            # Create a unique path for the current line
-            current_path = ".".join([s[1] for s in stack] + [key]) if stack else key
+            # Extend the parent's path rather than rejoining the whole stack
+            parent_path = stack[-1][2] + "." if stack else ""
+            current_path = parent_path + key
 
             # Check for duplicate keys in the same scope
             if current_path in path_registry:
@@ -157,22 +218,17 @@ class FloYaml:
                 # Update path registry to include the new unique key under the same path
                 path_registry[current_path].append(unique_key)
                 # Update the stack with the new unique key instead of the original key
-                stack.append((indent, unique_key))
+                stack.append((indent, unique_key, parent_path + unique_key))
             else:
                 output.append((indent, line))
                 # Initialize the path entry with the original key
                 path_registry[current_path] = [key]
-                stack.append((indent, key))
+                stack.append((indent, key, current_path))
 
         return output
 
     # ANCHOR
-    def __single_locate(self, data, key: str):
-        index = None
-        if "[" in key and "]" in key:
-            key, index = key.split("[")
-            index = int(index.rstrip("]"))
-
+    def __single_locate(self, data, key: str, index, prefix: str):
         if not isinstance(data, dict):
             raise TypeError("Data must be a dictionary")
 
@@ -182,13 +238,13 @@ class FloYaml:
         if index is None:
             ret = []
             for k, v in data.items():
-                if k.startswith(f"{key}_floyaml_") or k == key:
+                if k.startswith(prefix) or k == key:
                     ret.append(v)
             return ret
 
         counter = 0
         for k, v in data.items():
-            if k.startswith(f"{key}_floyaml_") or k == key:
+            if k.startswith(prefix) or k == key:
                 if index == counter:
                     return v
                 counter += 1
@@ -203,12 +259,11 @@ class FloYaml:
         VAL['a[1]']         => get the 2nd __val__ of type a
         """
         current = self.__datadict
-        for key in keys:
-            if not isinstance(key, _FloYaml__Val):
-                current = self.__single_locate(current, key)
+        for key, index, prefix, is_val in _parse_keys(tuple(keys)):
+            current = self.__single_locate(current, key, index, prefix)
+            if not is_val:
                 continue
 
-            current = self.__single_locate(current, key.key)
             if isinstance(current, list):
                 current = [i["__val__"] if isinstance(i, dict) else i for i in current]
             elif isinstance(current, dict) and "__val__" in current:
@@ -287,44 +342,44 @@ class FloYaml:
         renamed with the '_floyaml_' pattern to maintain clear and standard output.
         """
 
+        buf = io.StringIO()
+        write = buf.write
+        step = " " * self.__baseindent
+
         def recurse(obj, level=0):
-            entries = []
-            indent = " " * self.__baseindent * level
+            indent = step * level
 
             if isinstance(obj, dict):
                 for key, val in obj.items():
                     # Normalize key by removing any '_floyaml_' patterns
-                    normalized_key = key.split("_floyaml_")[0]
-
-                    if isinstance(val, dict):
-                        entries.append(f"{indent}{normalized_key}:")
-                        entries.extend(recurse(val, level + 1))
-                    elif isinstance(val, list):
-                        entries.append(f"{indent}{normalized_key}:")
-                        for item in val:
-                            entry = recurse(item, level + 1)
-                            # List items prefixed with a dash
-                            prefixed_entry = "\n".join(
-                                f"{indent + ' ' * self.__baseindent}- {line}"
-                                for line in entry.split("\n")
-                            )
-                            entries.append(prefixed_entry)
+                    normalized_key = str(key).split("_floyaml_")[0]
+
+                    if isinstance(val, (dict, list)):
+                        write(f"{indent}{normalized_key}:\n")
+                        recurse(val, level + 1)
                     else:
                         # Handle simple values directly
-                        entries.append(f"{indent}{normalized_key}: {val}")
+                        write(f"{indent}{normalized_key}: {val}\n")
             elif isinstance(obj, list):
                 for item in obj:
-                    # Handle lists at the top level specially (unlikely but included for completeness)
-                    entries.append(f"{indent}- {recurse(item, level + 1)}")
+                    # List items prefixed with a dash, nested blocks go below it
+                    if isinstance(item, (dict, list)):
+                        write(f"{indent}-\n")
+                        recurse(item, level + 1)
+                    else:
+                        write(f"{indent}- {item}\n")
             else:
                 # Simple values without key
-                return f"{indent}{obj}"
-
-            return "\n".join(entries)
+                write(f"{indent}{obj}\n")
 
-        return recurse(self.__datadict)
+        recurse(self.__datadict)
+        return buf.getvalue()[:-1]
 
     # ANCHOR
     @property
     def datadict(self):
         return MappingProxyType(self.__datadict)
+
+    @property
+    def copiedDict(self):
+        return _plain_copy(self.__datadict)
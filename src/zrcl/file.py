@@ -1,20 +1,95 @@
+from collections import OrderedDict
 from contextlib import contextmanager
+import copy
+import ctypes
+from functools import wraps
 from inspect import signature
+import json
 import os
 import tomllib
 from zrcl.ext_hashlib import hash_file
 from zrcl.ext_json import read_json
 import pickle
+import re
+import struct
+import sys
+import time
 import toml
 import typing
 
+_PICKLE_MAGIC = pickle.PROTO
+
+# path -> (mtime_ns, size, sha256) of the last hash taken
+_hash_meta_cache: typing.Dict[str, typing.Tuple[int, int, str]] = {}
+# files modified this recently may be rewritten within the same timestamp tick,
+# so their cached digest isn't trusted (same idea as git's "racy" entries)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _cached_sha256(path: str) -> str:
+    stat = os.stat(path)
+    cached = _hash_meta_cache.get(path)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+        and time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS
+    ):
+        return cached[2]
+
+    digest = hash_file(path)
+    _hash_meta_cache[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
 
 class QuickFileError(Exception):
     pass
 
 
+# how many files each memoized loader remembers
+LOADER_CACHE_SIZE = 256
+
+
+def _stat_memoized(parse: typing.Callable[[str], typing.Any]):
+    """
+    Memoizes a loader per path on (mtime_ns, size). Hits hand out a deep copy so
+    callers can't mutate the cached value; racy (just written) files aren't cached.
+    """
+    cache = OrderedDict()
+
+    @wraps(parse)
+    def load(path: str):
+        stat = os.stat(path)
+        cached = cache.get(path)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            cache.move_to_end(path)
+            return copy.deepcopy(cached[2])
+
+        value = parse(path)
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            cache[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(value))
+            if len(cache) > LOADER_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.pop(path, None)
+        return value
+
+    load.cache_clear = cache.clear
+    return load
+
+
+def _read_all(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@_stat_memoized
 def load_toml(path: str):
-    return tomllib.load(open(path, "rb"))
+    return tomllib.loads(_read_all(path).decode("utf-8"))
 
 
 def save_toml(path: str, data: dict):
@@ -22,10 +97,13 @@ def save_toml(path: str, data: dict):
         toml.dump(data, f)
 
 
+@_stat_memoized
 def load_yaml(path: str):
     import yaml
 
-    return yaml.load(open(path, "r"), Loader=yaml.SafeLoader)
+    return yaml.load(
+        _read_all(path), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    )
 
 
 def save_yaml(path: str, data: dict):
@@ -36,7 +114,7 @@ def save_yaml(path: str, data: dict):
 
 
 def load_pickle(path: str):
-    return pickle.load(open(path, "rb"))
+    return pickle.loads(_read_all(path))
 
 
 def save_pickle(path: str, data: dict):
@@ -44,42 +122,58 @@ def save_pickle(path: str, data: dict):
         pickle.dump(data, f)
 
 
+_LOADERS: typing.Dict[str, typing.Callable[[str], typing.Any]] = {
+    "json": read_json,
+    "toml": load_toml,
+    "yaml": load_yaml,
+    "yml": load_yaml,
+    "pickle": load_pickle,
+    "pkl": load_pickle,
+}
+
+
 def _extension_read(path: str):
-    if "." not in os.path.basename(path):
+    loader = _LOADERS.get(os.path.splitext(path)[1][1:].lower())
+    if loader is None:
         raise QuickFileError("Unsupported file type")
-    match path.split(".")[-1]:
-        case "json":
-            return read_json(path)
-        case "toml":
-            return load_toml(path)
-        case "yaml":
-            return load_yaml(path)
-        case "pickle":
-            return load_pickle(path)
-        case _:
-            raise QuickFileError("Unsupported file type")
+    return loader(path)
+
+
+# Signature classifier over the first 80 bytes, one alternative per format and
+# tried in the same order as the original cascade:
+#   json   - first non-blank byte is a curly brace
+#   toml   - a key=value pair with no "[" before the first "="
+#   yaml   - first non-blank bytes are "---"
+#   pickle - the PROTO opcode every protocol 2+ stream starts with
+_SIG = re.compile(
+    rb"(?P<json>\s*\{)|(?P<toml>[^\[=]*=)|(?P<yaml>\s*---)|(?P<pickle>"
+    + re.escape(_PICKLE_MAGIC)
+    + rb")"
+)
 
 
 def _signature_load(path: str):
-    with open(path, "rb") as f:
-        # Read the first few bytes to guess the file type
-        fsignature = f.read(80)  # Read more bytes to better identify other formats
+    # Read the file once; the loaders below parse these bytes rather than
+    # reopening the file
+    data = _read_all(path)
+
+    # Guess the file type from the first few bytes
+    match = _SIG.match(data, 0, 80)
+    kind = match.lastgroup if match is not None else None
+
+    if kind == "json":
+        return json.loads(data)
 
-    # Identify JSON by the starting curly brace
-    if fsignature.strip().startswith(b"{"):
-        return read_json(path)
+    elif kind == "toml":
+        return tomllib.loads(data.decode("utf-8"))
 
-    # Identify TOML by the presence of a key=value pair typical in TOML files
-    elif b"=" in fsignature and b"[" not in fsignature[: fsignature.find(b"=")].strip():
-        return load_toml(path)
+    elif kind == "yaml":
+        import yaml
 
-    # Identify YAML by typical starting indicators like "---"
-    elif fsignature.strip().startswith(b"---"):
-        return load_yaml(path)
+        return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
-    # Identify Pickle by checking the pickle magic number
-    elif fsignature.startswith(pickle.dumps(pickle.MAGIC_NUMBER)):
-        return load_pickle(path)
+    elif kind == "pickle":
+        return pickle.loads(data)
 
     else:
         raise QuickFileError("Unsupported file type or unknown signature")
@@ -100,30 +194,22 @@ def read_file(path: str, known_ext: str = None):
         QuickFileError: If the file type is not supported.
     """
     if known_ext:
-        match known_ext:
-            case "json":
-                return read_json(path)
-            case "toml":
-                return load_toml(path)
-            case "yaml":
-                return load_yaml(path)
-            case "pickle":
-                return load_pickle(path)
-            case _:
-                raise QuickFileError("Unsupported file type")
+        loader = _LOADERS.get(known_ext.lower())
+        if loader is None:
+            raise QuickFileError("Unsupported file type")
+        return loader(path)
 
     try:
         return _extension_read(path)
     except QuickFileError:
         return _signature_load(path)
-    import os
 
 
 class FilePropertyMeta:
     types = typing.Literal["mdate", "sha256", "size", "adate"]
     mapping: typing.Dict[types, typing.Callable[[str], typing.Any]] = {
         "mdate": os.path.getmtime,
-        "sha256": lambda path: hash_file(path),
+        "sha256": _cached_sha256,
         "size": os.path.getsize,
         "adate": os.path.getatime,
     }
@@ -142,6 +228,29 @@ class FilePropertyMeta:
             FilePropertyMeta.callBackHooks[hook] = callback
 
 
+class _FilePropertyEntry:
+    """
+    The watch record and the loaded content for one path.
+    """
+
+    __slots__ = ("record", "content")
+
+    def __init__(self):
+        self.record = {}
+        self.content = None
+
+
+# path -> entry, shared by every FileProperty watching that path
+_file_property_cache: typing.Dict[str, _FilePropertyEntry] = {}
+
+
+def _touch(path: str):
+    open(path, "w").close()
+
+
+_DEFAULT_WATCHING = ("size", ("mdate", "sha256"))
+
+
 class FileProperty:
     """
     Class for handling file properties.
@@ -155,27 +264,24 @@ class FileProperty:
 
     """
 
-    _properties = {}
-    _cachedContent = {}
-
     def __init__(
         self,
         path: typing.Union[property, str],
-        watching: typing.List[
-            typing.Union[typing.List[FilePropertyMeta.types], FilePropertyMeta.types]
-        ] = ["size", ["mdate", "sha256"]],
+        watching: typing.Sequence[
+            typing.Union[
+                typing.Sequence[FilePropertyMeta.types], FilePropertyMeta.types
+            ]
+        ] = None,
         customLoad: typing.Callable[[str], typing.Any] = None,
         customWatch: typing.Callable[[str], typing.Any] = None,
-        fileCreate: typing.Callable[[str], typing.Any] = lambda path: open(
-            path, "w"
-        ).close(),
-        callbacks: typing.List[typing.Union[str, typing.Callable]] = [],
+        fileCreate: typing.Callable[[str], typing.Any] = _touch,
+        callbacks: typing.Sequence[typing.Union[str, typing.Callable]] = None,
     ):
-        self.watching = watching
+        self.watching = watching if watching is not None else _DEFAULT_WATCHING
         self.path = path
         self.customLoad = customLoad
         self.customWatch = customWatch
-        self.callbacks = callbacks
+        self.callbacks = tuple(callbacks) if callbacks else ()
 
         if fileCreate and not os.path.exists(path):
             fileCreate(path)
@@ -183,12 +289,14 @@ class FileProperty:
     def _needToRefetch(
         self,
         watch: typing.Union[
-            typing.List[FilePropertyMeta.types], FilePropertyMeta.types
+            typing.Sequence[FilePropertyMeta.types], FilePropertyMeta.types
         ],
         record: typing.Dict,
     ):
-        if isinstance(watch, list):
-            return any(self._needToRefetch(w, record) for w in watch)
+        if isinstance(watch, (list, tuple)):
+            # check every entry so none of the recorded values go stale
+            changed = [self._needToRefetch(w, record) for w in watch]
+            return any(changed)
 
         old_value = record.get(watch)
         new_value = (
@@ -207,23 +315,118 @@ class FileProperty:
         if not os.path.exists(path):
             return None
 
-        if path not in self._properties:
-            self._properties[path] = {}
+        entry = _file_property_cache.get(path)
+        if entry is None:
+            entry = _file_property_cache[path] = _FilePropertyEntry()
 
-        if not self._needToRefetch(self.watching, self._properties[path]):
-            return self._cachedContent.get(path)
+        if not self._needToRefetch(self.watching, entry.record):
+            return entry.content
 
         content = self.customLoad(path) if self.customLoad else read_file(path)
-        self._cachedContent[path] = content
+        entry.content = content
 
         for callback in self.callbacks:
             resolved_callback = FilePropertyMeta.callBackHooks.get(callback, callback)
-            resolved_callback(path, content, self._properties[path])
+            resolved_callback(path, content, entry.record)
 
         return content
 
 
 # ANCHOR change monitor
+class _Inotify:
+    """
+    Minimal non-blocking inotify binding over ctypes (Linux only).
+    """
+
+    MODIFY = 0x00000002
+    ATTRIB = 0x00000004
+    MOVED_FROM = 0x00000040
+    MOVED_TO = 0x00000080
+    CREATE = 0x00000100
+    DELETE = 0x00000200
+    Q_OVERFLOW = 0x00004000
+    IGNORED = 0x00008000
+    MASK = MODIFY | ATTRIB | MOVED_FROM | MOVED_TO | CREATE | DELETE
+    # entries coming and going is all that moves a folder's own mtime
+    ENTRIES = MOVED_FROM | MOVED_TO | CREATE | DELETE
+
+    _EVENT = struct.Struct("iIII")
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(None, use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [
+                    ctypes.c_int,
+                    ctypes.c_char_p,
+                    ctypes.c_uint32,
+                ]
+            except (OSError, AttributeError):
+                return False
+            cls._libc = libc
+        return True
+
+    def __init__(self):
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.dirs: typing.Dict[int, str] = {}
+
+    def add(self, path: str, mask: typing.Optional[int] = None):
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(path), self.MASK if mask is None else mask
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self.dirs[wd] = path
+
+    def read(self) -> typing.Optional[typing.List[typing.Tuple[str, int]]]:
+        """
+        Drains the queued events as (path, mask) pairs, or None if the kernel
+        queue overflowed and events were lost.
+        """
+        events = []
+        overflowed = False
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = self._EVENT.unpack_from(buf, offset)
+                offset += self._EVENT.size
+                name = buf[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.Q_OVERFLOW:
+                    overflowed = True
+                elif mask & self.IGNORED:
+                    self.dirs.pop(wd, None)
+                elif wd in self.dirs and name:
+                    events.append(
+                        (os.path.join(self.dirs[wd], os.fsdecode(name)), mask)
+                    )
+
+        return None if overflowed else events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __del__(self):
+        self.close()
+
+
 class FolderWatcher:
     """
     A class for watching a folder and its subfolders for changes.
@@ -232,21 +435,52 @@ class FolderWatcher:
     It provides a mechanism to detect when a file has been created, modified, or deleted.
     """
 
-    def __init__(self, path: str, deep: bool = False, detailed: bool = False):
+    def __init__(
+        self,
+        path: str,
+        deep: bool = False,
+        detailed: bool = False,
+        mode: typing.Literal["poll", "notify"] = "poll",
+    ):
+        """
+        Args:
+            path (str): The folder to watch.
+            deep (bool, optional): Whether to watch subfolders too. Defaults to False.
+            detailed (bool, optional): Reserved. Defaults to False.
+            mode (Literal["poll", "notify"], optional): "poll" re-scans the whole tree on
+                every `track_changes`; "notify" uses inotify (Linux only, otherwise it
+                falls back to polling) so only changed entries are looked at.
+                Defaults to "poll".
+        """
         self.path = path
         self.deep = deep
         self.detailed = detailed
         self.watched = {}
         self.changed = {}
+        self._created = []
+        self._deleted = []
+        self._modified = []
+        self._inotify = None
+        if mode == "notify" and _Inotify.available():
+            self._inotify = _Inotify()
+            self._inotify.add(path)
         self.snapshot()
 
+    def close(self):
+        """
+        Releases the inotify handle, if any; the watcher falls back to polling.
+        """
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
     def snapshot(self):
         """
         Snapshot the directory and its subdirectories to keep track of file changes.
 
         This method takes a snapshot of the directory and its subdirectories, storing
         information about each file's modification date, size, and whether it is a directory.
-        It uses the `os.walk` function to recursively traverse the directory tree.
+        It uses `os.scandir` so each entry costs a single `stat` call.
 
         Parameters:
             None
@@ -260,53 +494,57 @@ class FolderWatcher:
         """
         self.watched = {}
         try:
-            if self.deep:
-                for root, dirs, files in os.walk(self.path):
-                    for name in files + dirs:
-                        full_path = os.path.join(root, name)
-                        is_dir = os.path.isdir(full_path)
-                        try:
-                            stats = {
-                                "mdate": os.path.getmtime(full_path),
-                                "size": os.path.getsize(full_path),
-                                "isdir": is_dir,
-                            }
-                            if self.detailed:
-                                # Add detailed stats if required
-                                pass
-                            self.watched[full_path] = stats
-                        except OSError:
-                            continue
-            else:
-                for name in os.listdir(self.path):
-                    full_path = os.path.join(self.path, name)
-                    is_dir = os.path.isdir(full_path)
-                    try:
-                        stats = {
-                            "mdate": os.path.getmtime(full_path),
-                            "size": os.path.getsize(full_path),
-                            "isdir": is_dir,
-                        }
-                        if self.detailed:
-                            # Add detailed stats if required
-                            pass
-                        self.watched[full_path] = stats
-                    except OSError:
-                        continue
-
+            self._scan_tree(self.path, self.watched)
         except Exception as e:
             print(f"Failed to snapshot directory {self.path}: {str(e)}")
 
+    def _scan_tree(self, root: str, into: dict):
+        """
+        Records the stats of every entry below `root` into `into` (descending into
+        subfolders when deep). Raises if `root` itself can't be listed.
+        """
+        pending = [root]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                # like os.walk, skip subfolders that can't be listed
+                if current == root:
+                    raise
+                continue
+
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+
+                into[entry.path] = {
+                    "mdate": stat.st_mtime,
+                    "size": stat.st_size,
+                    "isdir": is_dir,
+                }
+                if entry.is_dir(follow_symlinks=False):
+                    if self.deep:
+                        pending.append(entry.path)
+                        if self._inotify is not None:
+                            self._inotify.add(entry.path)
+                    elif self._inotify is not None:
+                        self._watch_shallow(entry.path)
+
     def track_changes(self):
         """
         Tracks changes between the current state of the watched files and the previous state.
 
-        This method clears the `changed` dictionary and creates a copy of the `watched` dictionary.
+        This method clears the `changed` dictionary and keeps the previous `watched` dictionary.
         It then takes a snapshot of the current state of the files being watched.
 
-        For each file in the `old_watched` dictionary, it checks if the file still exists.
+        For each file in the `old_watched` dictionary, it checks if the file is still in the new snapshot.
         If the file does not exist, it adds the file path to the `changed` dictionary with the value "deleted".
-        If the file exists, it checks if the modification time or size of the file has changed compared to the previous state.
+        If the file exists, it checks if the snapshotted modification time or size of the file has changed compared to the previous state.
         If either the modification time or size has changed, it adds the file path to the `changed` dictionary with the value "modified".
 
         After checking all the files in `old_watched`, it finds the files that were created by comparing the set of files in `watched` with the set of files in `old_watched`.
@@ -315,20 +553,124 @@ class FolderWatcher:
         This method does not return anything.
         """
         self.changed.clear()
-        old_watched = self.watched.copy()
+        # bucket while diffing so the properties below don't rescan `changed`
+        self._created = []
+        self._deleted = []
+        self._modified = []
+
+        if self._inotify is not None:
+            events = self._inotify.read()
+            if events is not None:
+                self._apply_events(events)
+                return
+            # the event queue overflowed; fall through to a full rescan
+
+        # snapshot() rebinds self.watched, so the old dict can be kept as-is
+        old_watched = self.watched
 
         self.snapshot()
         for k, v in old_watched.items():
-            if not os.path.exists(k):
-                self.changed[k] = "deleted"
-            elif v and (
-                os.path.getmtime(k) != v["mdate"] or os.path.getsize(k) != v["size"]
-            ):
-                self.changed[k] = "modified"
-
-        newlycreated = set(self.watched) - set(old_watched)
+            current = self.watched.get(k)
+            if current is None:
+                self._record(k, "deleted")
+            elif v and (current["mdate"] != v["mdate"] or current["size"] != v["size"]):
+                self._record(k, "modified")
+
+        newlycreated = self.watched.keys() - old_watched.keys()
         for k in newlycreated:
-            self.changed[k] = "created"
+            self._record(k, "created")
+
+    def _record(self, path: str, change: str):
+        self.changed[path] = change
+        if change == "created":
+            self._created.append(path)
+        elif change == "deleted":
+            self._deleted.append(path)
+        else:
+            self._modified.append(path)
+
+    def _apply_events(self, events: typing.List[typing.Tuple[str, int]]):
+        """
+        Folds inotify events into the same created/deleted/modified result a full
+        rescan would give, only stat-ing the paths the events mention.
+        """
+        touched = {}  # path -> "created" / "deleted" / "changed", in event order
+        for path, mask in events:
+            parent = os.path.dirname(path)
+            if not self.deep and parent != self.path:
+                # from a shallow watch: only the first-level folder's mtime moved
+                touched.setdefault(parent, "changed")
+                continue
+            if mask & (_Inotify.CREATE | _Inotify.MOVED_TO):
+                touched[path] = "created"
+            elif mask & (_Inotify.DELETE | _Inotify.MOVED_FROM):
+                touched[path] = "deleted"
+            else:
+                touched.setdefault(path, "changed")
+                continue
+            # adding or removing an entry also bumps its folder's mtime
+            if parent != self.path:
+                touched.setdefault(parent, "changed")
+
+        for path, event in touched.items():
+            if event == "deleted":
+                self._forget(path)
+                continue
+
+            current = {}
+            try:
+                if event == "created":
+                    self._scan_created(path, current)
+                else:
+                    stat = os.stat(path)
+                    current[path] = {
+                        "mdate": stat.st_mtime,
+                        "size": stat.st_size,
+                        "isdir": os.path.isdir(path),
+                    }
+            except OSError:
+                # gone again before we looked
+                self._forget(path)
+                continue
+
+            for k, v in current.items():
+                prev = self.watched.get(k)
+                self.watched[k] = v
+                if prev is None:
+                    self._record(k, "created")
+                elif prev["mdate"] != v["mdate"] or prev["size"] != v["size"]:
+                    self._record(k, "modified")
+
+    def _scan_created(self, path: str, into: dict):
+        stat = os.stat(path)
+        is_dir = os.path.isdir(path)
+        into[path] = {"mdate": stat.st_mtime, "size": stat.st_size, "isdir": is_dir}
+        if self.deep and is_dir and not os.path.islink(path):
+            # watch it first so nothing created meanwhile slips through, then
+            # pick up whatever already landed inside
+            self._inotify.add(path)
+            self._scan_tree(path, into)
+        elif is_dir and not os.path.islink(path):
+            self._watch_shallow(path)
+
+    def _watch_shallow(self, path: str):
+        """
+        Without `deep`, first-level subfolders are still listed, so watch them just
+        for entries coming and going to catch their mtime changing like a rescan does.
+        """
+        try:
+            self._inotify.add(path, _Inotify.ENTRIES)
+        except OSError:
+            pass
+
+    def _forget(self, path: str):
+        if self.watched.pop(path, None) is not None:
+            self._record(path, "deleted")
+        # a folder that vanished (or moved away) takes its watched children with it
+        prefix = path + os.sep
+        for k in [k for k in self.watched if k.startswith(prefix)]:
+            del self.watched[k]
+            self._record(k, "deleted")
 
     @contextmanager
     def watch(self):
@@ -345,30 +687,18 @@ class FolderWatcher:
         """
         Returns the list of created files.
         """
-        created = []
-        for k, v in self.changed.items():
-            if v == "created":
-                created.append(k)
-        return created
+        return self._created
 
     @property
     def deleted(self):
         """
         Returns the list of deleted files.
         """
-        deleted = []
-        for k, v in self.changed.items():
-            if v == "deleted":
-                deleted.append(k)
-        return deleted
+        return self._deleted
 
     @property
     def modified(self):
         """
         Returns the list of modified files.
         """
-        modified = []
-        for k, v in self.changed.items():
-            if v == "modified":
-                modified.append(k)
-        return modified
+        return self._modified
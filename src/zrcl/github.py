@@ -1,14 +1,155 @@
+from contextlib import closing
 from datetime import datetime
 import io
+import json
+import logging
+import os
 import re
+import shutil
+import sqlite3
+import time
 import typing
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zrcl.ext as ext
 
 GITHUB_HEADERS = {
     "Accept": "application/vnd.github.v3+json",
 }
 
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+
+
+def _make_session() -> requests.Session:
+    # one pooled keep-alive session, so repeated calls skip the TCP/TLS setup;
+    # requests already asks for gzip/deflate by default
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+# seconds a fetched API response is served without asking GitHub again; the
+# entries are shared between processes through a small sqlite file
+GITHUB_CACHE_TTL = float(os.environ.get("ZRCL_GITHUB_CACHE_TTL", 300))
+GITHUB_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "zrcl",
+    "github.sqlite",
+)
+
+_CacheEntry = typing.Tuple[typing.Dict[str, str], bytes, float]
+
+# url -> (conditional request headers, last 200 body, expiry timestamp)
+_conditional_cache: typing.Dict[str, _CacheEntry] = {}
+
+
+def _disk_connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(GITHUB_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(GITHUB_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses"
+        " (url TEXT PRIMARY KEY, validators TEXT, body BLOB, expires REAL)"
+    )
+    return conn
+
+
+def _disk_get(url: str) -> typing.Optional[_CacheEntry]:
+    if GITHUB_CACHE_TTL <= 0:
+        return None
+    try:
+        with closing(_disk_connect()) as conn:
+            row = conn.execute(
+                "SELECT validators, body, expires FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        logging.debug("github disk cache unavailable", exc_info=True)
+        return None
+    if row is None:
+        return None
+    return json.loads(row[0]), row[1], row[2]
+
+
+def _disk_put(url: str, entry: _CacheEntry):
+    if GITHUB_CACHE_TTL <= 0:
+        return
+    try:
+        with closing(_disk_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (url, json.dumps(entry[0]), entry[1], entry[2]),
+            )
+    except (sqlite3.Error, OSError):
+        logging.debug("github disk cache unavailable", exc_info=True)
+
+
+def _conditional_json(url: str, raise_for_status: bool = False):
+    """
+    GETs a GitHub API url as JSON. Responses younger than GITHUB_CACHE_TTL are
+    served from the in-process or on-disk cache without any request; older ones
+    are revalidated with If-None-Match / If-Modified-Since so unchanged
+    resources come back as a bodyless 304 (which GitHub also doesn't count
+    against the rate limit).
+    """
+    cached = _conditional_cache.get(url)
+    if cached is None:
+        cached = _disk_get(url)
+        if cached is not None:
+            _conditional_cache[url] = cached
+
+    now = time.time()
+    if cached is not None and now < cached[2]:
+        # parse the stored body so callers never share a mutable result
+        return json.loads(cached[1])
+
+    headers = dict(GITHUB_HEADERS)
+    if cached is not None:
+        headers.update(cached[0])
+
+    response = _SESSION.get(url, headers=headers)
+    logging.debug(
+        "github %s: rate limit remaining %s",
+        url,
+        response.headers.get("X-RateLimit-Remaining"),
+    )
+
+    if response.status_code == 304 and cached is not None:
+        # unchanged, only the expiry moves forward
+        cached = (cached[0], cached[1], now + GITHUB_CACHE_TTL)
+        _conditional_cache[url] = cached
+        _disk_put(url, cached)
+        return json.loads(cached[1])
+
+    if raise_for_status:
+        response.raise_for_status()
+
+    data = response.json()
+    if response.status_code == 200:
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators or GITHUB_CACHE_TTL > 0:
+            cached = (validators, response.content, now + GITHUB_CACHE_TTL)
+            _conditional_cache[url] = cached
+            _disk_put(url, cached)
+    return data
+
+
 raw_url = "https://raw.githubusercontent.com/{url}"
 
 
@@ -23,16 +164,18 @@ def download_github_raw_content(url: str, save: str = None):
         bytes: The raw content downloaded from the specified URL.
     """
     url = raw_url.format(url=url)
-    res = requests.get(url, headers=GITHUB_HEADERS)
-    # if 404
-    if res.status_code == 404:
-        raise RuntimeError("File not found on github")
+    with _SESSION.get(url, headers=GITHUB_HEADERS, stream=True) as res:
+        # if 404
+        if res.status_code == 404:
+            raise RuntimeError("File not found on github")
 
-    if not save:
-        return res.content
+        if not save:
+            return res.content
 
-    with open(save, "wb") as f:
-        f.write(res.content)
+        # stream straight to disk instead of holding the whole file in memory
+        res.raw.decode_content = True
+        with open(save, "wb") as f:
+            shutil.copyfileobj(res.raw, f, DOWNLOAD_BLOCK_SIZE)
 
 
 last_commit_api_url = "https://api.github.com/repos/{id}/commits?path={filename}"
@@ -53,10 +196,9 @@ def git_last_commit(id, filename):
     url = last_commit_api_url.format(id=id, filename=filename)
     url += "&limit=1"
 
-    r = requests.get(url, headers=GITHUB_HEADERS)
     try:
-        rjson = r.json()
-    except Exception:
+        rjson = _conditional_json(url)
+    except ValueError:  # body wasn't JSON
         return None
 
     return rjson
@@ -75,10 +217,28 @@ def extract_commit(commitjson: dict, type: typing.Literal["date", "sha"] = "sha"
         return ext.get_deep(commitjson, 0, "sha")
 
 
+def _name_matcher(pattern: str, match: str) -> typing.Callable[[str], typing.Any]:
+    """
+    Builds the name test for a match mode once, so the per-release / per-asset
+    loops only make a single call. Note that "glob" is a regular expression
+    applied with re.match, not a shell glob.
+    """
+    if match == "exact":
+        return lambda value: value == pattern
+    if match == "startswith":
+        return lambda value: value.startswith(pattern)
+    if match == "contains":
+        return lambda value: pattern in value
+    if match == "endswith":
+        return lambda value: value.endswith(pattern)
+    if match == "glob":
+        return re.compile(pattern).match
+    raise ValueError(f"Unsupported match mode: {match}")
+
+
 def github_get_releases(repo: str, limit=10):
     url = f"https://api.github.com/repos/{repo}/releases?limit={limit}"
-    response = requests.get(url, headers=GITHUB_HEADERS)
-    return response.json()
+    return _conditional_json(url)
 
 
 def github_release_meta(
@@ -110,26 +270,18 @@ def github_release_meta(
         url = f"{base_url}/tags/{name}"
     elif name:
         releases = github_get_releases(repo, 10)
+        matches = _name_matcher(name, match)
+        field = "tag_name" if match_release_tag else "name"
         for release in releases:
-            match_var = release["tag_name"] if match_release_tag else release["name"]
-
-            if match == "startswith" and match_var.startswith(name):
-                return release
-            elif match == "contains" and name in match_var:
-                return release
-            elif match == "endswith" and match_var.endswith(name):
-                return release
-            elif match == "glob" and re.match(name, match_var) is not None:
+            if matches(release[field]):
                 return release
 
         raise ValueError(f"Could not find release with tag {name}")
     else:
         url = f"{base_url}/latest"
 
-    # Request the release data from GitHub
-    response = requests.get(url, headers=GITHUB_HEADERS)
-    response.raise_for_status()  # Raises an HTTPError for bad responses
-    return response.json()
+    # Request the release data from GitHub, raising an HTTPError for bad responses
+    return _conditional_json(url, raise_for_status=True)
 
 
 def download_release(
@@ -156,31 +308,25 @@ def download_release(
     Raises:
         requests.exceptions.HTTPError: If there is an error in the HTTP response.
     """
+    matches = _name_matcher(filename, match)
     for asset in releasejson.get("assets", []):
-        if match == "exact" and asset["name"] != filename:
-            continue
-        elif match == "startswith" and not asset["name"].startswith(filename):
-            continue
-        elif match == "contains" and filename not in asset["name"]:
-            continue
-        elif match == "endswith" and not asset["name"].endswith(filename):
-            continue
-        elif match == "glob" and re.match(filename, asset["name"]) is None:
+        if not matches(asset["name"]):
             continue
 
         download_url = asset["browser_download_url"]
         # download using stream
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
-
-        content = io.BytesIO()
-
-        for block in response.iter_content(1024):
-            content.write(block)
-
-        if save:
-            with open(save, "wb") as f:
-                f.write(content.getvalue())
-            return
+        with _SESSION.get(download_url, stream=True) as response:
+            response.raise_for_status()
+
+            if save:
+                # stream straight to disk instead of staging in memory
+                response.raw.decode_content = True
+                with open(save, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_BLOCK_SIZE)
+                return
+
+            content = io.BytesIO()
+            for block in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+                content.write(block)
 
         return content
@@ -1,5 +1,19 @@
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import typing
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# a line holding only "---", as front matter delimiters are matched by strip()
+_DELIMITER_RE = re.compile(rb"^[ \t]*---[ \t]*\r?$", re.M)
+
 
 def load_yaml_properties(md_file_path):
     """
@@ -11,34 +25,59 @@ def load_yaml_properties(md_file_path):
     Returns:
     dict or None: The parsed YAML data if successful, or None if there was an error.
     """
-    yaml_content = []
-    with open(md_file_path, "r") as file:
-        # Read the first line to check if it starts with ---
-        first_line = file.readline()
-        if first_line.strip() != "---":
+    with open(md_file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        # Check that the file starts with ---
+        if not size:
             print("No YAML front matter found.")
             return None
 
-        # Read the rest of the YAML content until the next ---
-        for line in file:
-            if line.strip() == "---":
-                break
-            yaml_content.append(line)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            opening = _DELIMITER_RE.match(mm)
+            if opening is None:
+                print("No YAML front matter found.")
+                return None
+
+            # The YAML content runs until the next --- (or the end of the file)
+            yaml_start = opening.end() + 1
+            closing = _DELIMITER_RE.search(mm, yaml_start)
+            yaml_bytes = mm[yaml_start : closing.start() if closing else size]
 
-    # Join the lines and parse the YAML content
-    yaml_str = "".join(yaml_content)
     try:
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_bytes, Loader=_SafeLoader)
         return data
     except yaml.YAMLError as e:
         print(f"Error parsing YAML: {e}")
         return None
 
 
+def _front_matter_span(data) -> typing.Tuple[int, int, int]:
+    """
+    Locates the front matter in `data` (bytes or mmap) as
+    (yaml start, yaml end, markdown start) byte offsets.
+    """
+    delimiters = _DELIMITER_RE.finditer(data)
+    opening = next(delimiters, None)
+    if opening is None:
+        return 0, 0, 0
+
+    yaml_start = min(opening.end() + 1, len(data))
+    closing = next(delimiters, None)
+    if closing is None:
+        # unterminated; keep the whole file as markdown
+        return yaml_start, len(data), 0
+
+    return yaml_start, closing.start(), min(closing.end() + 1, len(data))
+
+
 def dump_yaml_properties(md_file_path: str, new_data: dict):
     """
     A function to update YAML properties in a Markdown file.
 
+    Only the front matter is rewritten in place when the new block is the same
+    size; otherwise the markdown body is copied straight from the mapped file
+    into a replacement written next to it.
+
     Args:
         md_file_path (str): The file path of the Markdown file.
         new_data (dict): The new YAML properties to be updated.
@@ -46,39 +85,64 @@ def dump_yaml_properties(md_file_path: str, new_data: dict):
     Returns:
         None
     """
-    with open(md_file_path, "r+") as file:
-        lines = file.readlines()
-
-    yaml_content = []
-    markdown_content_start = 0
-    in_yaml = False
-
-    # Iterate over lines to find and extract the current YAML section
-    for i, line in enumerate(lines):
-        if line.strip() == "---":
-            if not in_yaml:
-                in_yaml = True  # Start of YAML section
-            else:
-                markdown_content_start = i + 1  # End of YAML section
-                break
-        elif in_yaml:
-            yaml_content.append(line)
-
-    # Parse the existing YAML content if any
-    existing_data = yaml.safe_load("".join(yaml_content)) if yaml_content else {}
-
-    # Update the existing YAML data with the new data
-    updated_data = {**existing_data, **new_data}
-
-    # Convert the updated YAML data back to a string
-    updated_yaml_str = yaml.safe_dump(updated_data, default_flow_style=False)
-
-    # Write the updated YAML and the unchanged Markdown content back to the file
-    with open(md_file_path, "w") as file:
-        file.write("---\n")
-        file.write(updated_yaml_str)
-        file.write("---\n")
-        file.writelines(lines[markdown_content_start:])
+    tmp_path = None
+    with open(md_file_path, "r+b") as file:
+        size = os.fstat(file.fileno()).st_size
+        mm = mmap.mmap(file.fileno(), 0) if size else None
+        try:
+            data = mm if mm is not None else b""
+            yaml_start, yaml_end, markdown_start = _front_matter_span(data)
+
+            # Parse the existing YAML content if any
+            existing_data = {}
+            if yaml_end > yaml_start:
+                existing_data = (
+                    yaml.load(data[yaml_start:yaml_end], Loader=_SafeLoader) or {}
+                )
+
+            # Update the existing YAML data with the new data
+            updated_data = {**existing_data, **new_data}
+            header = format_yaml_properties(updated_data, dumper=yaml.safe_dump)
+            header = header.encode()
+
+            if len(header) == markdown_start:
+                if data[:markdown_start] != header:
+                    mm[:markdown_start] = header
+                    mm.flush()
+                return
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(md_file_path))
+            )
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(header)
+                if mm is not None:
+                    with memoryview(mm) as view:
+                        tmp.write(view[markdown_start:])
+        except BaseException:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+            raise
+        finally:
+            if mm is not None:
+                mm.close()
+
+    shutil.copymode(md_file_path, tmp_path)
+    os.replace(tmp_path, md_file_path)
+
+
+def format_yaml_properties(new_data: dict, dumper=yaml.dump) -> str:
+    """
+    A function to render YAML properties as a front matter block.
+
+    Parameters:
+    new_data (dict): The YAML data to be rendered.
+    dumper (callable, optional): The YAML dump function to use. Defaults to yaml.dump.
+
+    Returns:
+    str: The front matter, including the enclosing --- lines.
+    """
+    return "---\n" + dumper(new_data, default_flow_style=False) + "---\n"
 
 
 def create_yaml_properties(md_file_path: str, new_data: dict):
@@ -93,6 +157,4 @@ def create_yaml_properties(md_file_path: str, new_data: dict):
     None
     """
     with open(md_file_path, "w") as file:
-        file.write("---\n")
-        yaml.dump(new_data, file, default_flow_style=False)
-        file.write("---\n")
+        file.write(format_yaml_properties(new_data))
@@ -6,7 +6,51 @@ from PIL import Image, ImageDraw, PngImagePlugin
 import io
 import json
 import os
-import base64
+import struct
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    # SIMD base64, only archives from before the original chunks need it
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+# Originals live in private ancillary PNG chunks (lowercase first two letters),
+# one per key holding b"<utf-8 key>\0<raw file bytes>"; viewers skip them
+_ORIGINAL_CHUNK = b"orIg"
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _read_original_chunks(path):
+    originals = {}
+    with open(path, "rb") as f:
+        if f.read(8) != _PNG_SIGNATURE:
+            return originals
+
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            length, cid = struct.unpack(">I4s", header)
+            if cid == _ORIGINAL_CHUNK:
+                key, _, raw = f.read(length).partition(b"\0")
+                originals[key.decode("utf-8")] = raw
+                f.seek(4, os.SEEK_CUR)  # crc
+            elif cid == b"IEND":
+                break
+            else:
+                f.seek(length + 4, os.SEEK_CUR)
+    return originals
 
 
 class PngZip:
@@ -17,6 +61,10 @@ class PngZip:
     def __init__(self, filename, mode="r"):
         self.filename = filename
         self.metadata = {}
+        # key -> original file bytes, for images stored as previews; archives
+        # from before the orIg chunks hold base64 str until first use
+        self._originals = {}
+        self._sum_w = self._sum_h = self._num_rects = 0
         self.current_width = 0
         self.current_height = 0
         self.composite_image = None
@@ -28,46 +76,48 @@ class PngZip:
         elif mode == "w" and os.path.exists(filename):
             os.remove(filename)
 
+    def __count_rects(self):
+        # running totals behind __calculate_average_dimensions
+        self._sum_w = self._sum_h = self._num_rects = 0
+        for meta in self.metadata.values():
+            if "rect" in meta:
+                self.__count_rect(meta["rect"], 1)
+
+    def __count_rect(self, rect, sign):
+        # rect is stored as (x, y, width, height)
+        self._sum_w += sign * (rect[2] - rect[0])
+        self._sum_h += sign * (rect[3] - rect[1])
+        self._num_rects += sign
+
     def __calculate_average_dimensions(self):
-        total_width = total_height = num_images = 0
-        for key in self.metadata:
-            if "rect" not in self.metadata[key]:
-                continue
-
-            rect = self.metadata[key]["rect"]
-            # rect is stored as (x, y, width, height)
-            width = rect[2] - rect[0]
-            height = rect[3] - rect[1]
-            total_width += width
-            total_height += height
-            num_images += 1
-
-        if num_images == 0:
+        if not self._num_rects:
             return 0, 0  # Default to 0,0 if no images have been added
 
-        avg_width = total_width / num_images
-        avg_height = total_height / num_images
-        return int(avg_width), int(avg_height)
-
-    def __save_original_image(self, img, key_name):
-        with io.BytesIO() as img_byte_arr:
-            img.save(
-                img_byte_arr, format=img.format
-            )  # Save the image in its original format
-            img_byte_arr.seek(0)  # Go to the start of the StringIO buffer
-            encoded_img = base64.b64encode(img_byte_arr.getvalue()).decode("utf-8")
-            self.metadata[key_name] = {
-                "original_data": encoded_img,
+        return self._sum_w // self._num_rects, self._sum_h // self._num_rects
+
+    def __original_bytes(self, key_name):
+        data = self._originals[key_name]
+        if isinstance(data, str):
+            data = self._originals[key_name] = b64decode(data)
+        return data
+
+    def __save_original_image(self, data, img, key_name):
+        # keep the source file bytes as they are, no decode and re-encode
+        self._originals[key_name] = data
+        self.metadata.setdefault(key_name, {}).update(
+            {
                 "original_format": img.format,
                 "original_size": img.size,
             }
+        )
 
     def add_image(self, image_path, key_name):
-        with Image.open(image_path) as img:
-            original_img = img.copy()
-            original_img.load()
+        with open(image_path, "rb") as f:
+            data = f.read()
+
+        # PIL decodes lazily, so only the preview path below pays for pixels
+        with Image.open(io.BytesIO(data)) as img:
             original_format = img.format
-            original_img.format = original_format
             img_size = img.size
             avg_width, avg_height = self.__calculate_average_dimensions()
             if not avg_width or not avg_height:
@@ -83,49 +133,88 @@ class PngZip:
                     if (avg_width and avg_height)
                     else (800, 600)
                 )
-                img.thumbnail(max_preview_size, Image.Resampling.LANCZOS)
+                self.__save_original_image(data, img, key_name)
+                # thumbnail keeps the aspect ratio, so the tighter side wins;
+                # mild shrinks look the same with the much cheaper bilinear
+                scale = min(
+                    max_preview_size[0] / img.width, max_preview_size[1] / img.height
+                )
+                resample = Image.Resampling.LANCZOS
+                if scale > 0.5:
+                    resample = Image.Resampling.BILINEAR
+                img.thumbnail(max_preview_size, resample)
                 self._add_image(img, key_name, is_preview=True)
-                self.__save_original_image(original_img, key_name)
             else:
                 # Directly add the image if it is a PNG and within size limits
+                self._originals.pop(key_name, None)
                 self._add_image(img, key_name, is_preview=False)
 
+    def __reserve_canvas(self, width, height):
+        """
+        Makes sure the composite canvas is at least width x height. The canvas
+        grows geometrically, so adding n images copies the old composite only
+        O(log n) times; save() crops it back to the used area.
+        """
+        canvas = self.composite_image
+        if canvas is None:
+            self.composite_image = Image.new("RGBA", (width, height))
+            return
+
+        if width <= canvas.width and height <= canvas.height:
+            return
+
+        if width > canvas.width:
+            width = max(width, canvas.width * 2)
+        else:
+            width = canvas.width
+        if height > canvas.height:
+            height = max(height, canvas.height * 2)
+        else:
+            height = canvas.height
+
+        new_canvas = Image.new("RGBA", (width, height))
+        new_canvas.paste(canvas, (0, 0))
+        self.composite_image = new_canvas
+
     def _add_image(self, img, key_name, is_preview=False):
         img.load()
         # Determine new canvas size
         new_width = max(self.current_width, img.width)
         new_height = self.current_height + img.height + 20  # Extra space for caption
 
-        # Create or resize the composite image
-        new_composite_image = Image.new("RGBA", (new_width, new_height))
-        if self.composite_image:
-            new_composite_image.paste(self.composite_image, (0, 0))
-        self.composite_image = new_composite_image
+        self.__reserve_canvas(new_width, new_height)
         self.current_width = new_width
 
-        # Draw caption
-        caption_img = Image.new("RGBA", (img.width, 20), (255, 255, 255))
-        draw = ImageDraw.Draw(caption_img)
-        draw.text(
-            (10, 5), key_name + (" (Preview)" if is_preview else ""), fill="black"
-        )
-
-        # Paste the image and caption into the composite image
+        # Paste the image into the composite image
         self.composite_image.paste(img, (0, self.current_height))
-        self.composite_image.paste(caption_img, (0, self.current_height + img.height))
+
+        # Draw the caption straight onto a white strip of the composite; only
+        # text that would spill past the image width needs its own clipped strip
+        caption = key_name + (" (Preview)" if is_preview else "")
+        caption_top = self.current_height + img.height
+        self.composite_image.paste(
+            (255, 255, 255, 255), (0, caption_top, img.width, caption_top + 20)
+        )
+        draw = ImageDraw.Draw(self.composite_image)
+        bbox = draw.textbbox((10, caption_top + 5), caption)
+        if bbox[2] <= img.width and bbox[3] <= caption_top + 20:
+            draw.text((10, caption_top + 5), caption, fill="black")
+        else:
+            caption_img = Image.new("RGBA", (img.width, 20), (255, 255, 255))
+            ImageDraw.Draw(caption_img).text((10, 5), caption, fill="black")
+            self.composite_image.paste(caption_img, (0, caption_top))
 
         # Update metadata
         if key_name not in self.metadata:
             self.metadata[key_name] = {}
+        elif "rect" in self.metadata[key_name]:
+            self.__count_rect(self.metadata[key_name]["rect"], -1)
 
+        rect = (0, self.current_height, img.width, self.current_height + img.height)
+        self.__count_rect(rect, 1)
         self.metadata[key_name].update(
             {
-                "rect": (
-                    0,
-                    self.current_height,
-                    img.width,
-                    self.current_height + img.height,
-                ),
+                "rect": rect,
                 "caption": key_name,
                 "is_preview": is_preview,
             }
@@ -137,17 +226,49 @@ class PngZip:
     def __setitem__(self, key_name, image_path):
         self.add_image(image_path, key_name)
 
+    def get_raw(self, key_name):
+        """
+        Returns the encoded bytes and format of an image without decoding it.
+
+        Originals stored next to a preview come back exactly as they were
+        added; images kept only in the composite are cropped and encoded as PNG.
+        Use this to write an image out or serve it; `zipped[key]` is the variant
+        that returns a PIL image.
+
+        Args:
+            key_name (str): The key the image was added under.
+
+        Returns:
+            tuple: (bytes, format)
+        """
+        metadata = self.metadata.get(key_name)
+        if metadata:
+            if key_name in self._originals:
+                return (
+                    self.__original_bytes(key_name),
+                    metadata.get("original_format", "PNG"),
+                )
+
+            elif self.composite_image:
+                with io.BytesIO() as buffer:
+                    self.composite_image.crop(metadata["rect"]).save(buffer, "PNG")
+                    return buffer.getvalue(), "PNG"
+
+        raise KeyError(f"Image with key {key_name} not found")
+
     def __getitem__(self, key_name):
+        """
+        Returns the image stored under `key_name` as a PIL image, see get_raw
+        for the undecoded bytes.
+        """
         metadata = self.metadata.get(key_name)
         if metadata:
-            # Check if original image data is stored in metadata
-            if "original_data" in metadata:
-                # Decode the original image from base64
+            # Check if the original image was stored next to the preview
+            if key_name in self._originals:
                 original_format = metadata.get("original_format", "PNG")
 
-                original_data = base64.b64decode(metadata["original_data"])
+                original_data = self.__original_bytes(key_name)
                 original_image = Image.open(io.BytesIO(original_data))
-                # original_image = Image.open(buffer)
                 original_image.format = (
                     original_format  # Optionally set the format if needed
                 )
@@ -162,15 +283,32 @@ class PngZip:
 
     def save(self):
         pnginfo = PngImagePlugin.PngInfo()
-        metadata_str = json.dumps(self.metadata)
+        metadata_str = _json_dumps(self.metadata)
         pnginfo.add_text("metadata", metadata_str)
+        for key_name in self._originals:
+            pnginfo.add(
+                _ORIGINAL_CHUNK,
+                key_name.encode("utf-8") + b"\0" + self.__original_bytes(key_name),
+                after_idat=True,
+            )
         assert self.composite_image
-        self.composite_image.save(self.filename, "PNG", pnginfo=pnginfo)
+        image = self.composite_image
+        if image.size != (self.current_width, self.current_height):
+            # drop the spare capacity reserved for further images
+            image = image.crop((0, 0, self.current_width, self.current_height))
+        image.save(self.filename, "PNG", pnginfo=pnginfo)
 
     def load(self):
         with Image.open(self.filename) as img:
             metadata_str = img.info.get("metadata", "{}")
-            self.metadata = json.loads(metadata_str)
+            self.metadata = _json_loads(metadata_str)
+            self.__count_rects()
+            self._originals = _read_original_chunks(self.filename)
+            # archives written before the chunks kept originals as base64
+            # inside the metadata
+            for key_name, meta in self.metadata.items():
+                if "original_data" in meta:
+                    self._originals[key_name] = meta.pop("original_data")
             self.composite_image = img.copy()
             self.current_width, self.current_height = img.size
 
@@ -1,18 +1,155 @@
+import sys
 from time import sleep
 import pyautogui
 import click
 import pygetwindow as gw
 import re
 
+# "[start:stop:step]" with every part optional, or a single "[index]"
+_SLICE_RE = re.compile(r"\[\s*(-?\d+)?\s*(?:(:)\s*(-?\d+)?\s*(?::\s*(-?\d+)?\s*)?)?\]")
+
+
+def _parse_slice(slice_):
+    match = _SLICE_RE.fullmatch(slice_.strip())
+    if match is None or match.groups() == (None, None, None, None):
+        raise ValueError(f"Invalid slice {slice_!r}, expected e.g. [1:-1] or [::-1]")
+
+    start, colon, stop, step = match.groups()
+    if colon is None:
+        return int(start)
+    return slice(*(None if part is None else int(part) for part in (start, stop, step)))
+
 
 def read_text_from_file(path, slice_):
     with open(path, "r") as file:
         text = file.read()
-    return eval(f"text{slice_}", {"text": text})
+    return apply_slice(text, slice_)
 
 
 def apply_slice(text, slice_):
-    return eval(f"text{slice_}", {"text": text})
+    return text[_parse_slice(slice_)]
+
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _EVENT_SYSTEM_FOREGROUND = 0x0003
+    _WINEVENT_OUTOFCONTEXT = 0x0000
+    _WinEventProc = ctypes.WINFUNCTYPE(
+        None,
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.HWND,
+        wintypes.LONG,
+        wintypes.LONG,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    )
+
+    def _wait_for_foreground(accept, check_current=False):
+        """
+        Sleeps in a message loop until the OS reports a foreground window for
+        which `accept(hwnd)` is true, instead of polling the active window.
+        """
+
+        @_WinEventProc
+        def callback(hook, event, hwnd, id_object, id_child, thread, event_time):
+            if hwnd and accept(hwnd):
+                _user32.PostQuitMessage(0)
+
+        hook = _user32.SetWinEventHook(
+            _EVENT_SYSTEM_FOREGROUND,
+            _EVENT_SYSTEM_FOREGROUND,
+            0,
+            callback,
+            0,
+            0,
+            _WINEVENT_OUTOFCONTEXT,
+        )
+        if not hook:
+            raise ctypes.WinError()
+
+        try:
+            # the hook is live now, so a switch right before it can't be missed
+            if check_current and accept(_user32.GetForegroundWindow()):
+                return
+
+            msg = wintypes.MSG()
+            while _user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                _user32.TranslateMessage(ctypes.byref(msg))
+                _user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            _user32.UnhookWinEvent(hook)
+
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    def _find_window_by_title(regex):
+        """
+        Walks the visible top-level windows once, reading only their titles,
+        and builds a pygetwindow object just for the first match (getAllWindows
+        builds one per window, each querying its rect).
+        """
+        found = []
+
+        @_WNDENUMPROC
+        def callback(hwnd, lparam):
+            if not _user32.IsWindowVisible(hwnd):
+                return True
+            length = _user32.GetWindowTextLengthW(hwnd)
+            title = ctypes.create_unicode_buffer(length + 1)
+            _user32.GetWindowTextW(hwnd, title, length + 1)
+            if regex.search(title.value):
+                found.append(hwnd)
+                return False
+            return True
+
+        _user32.EnumWindows(callback, 0)
+        return gw.Win32Window(found[0]) if found else None
+
+    def _wait_for_foreground_change():
+        _wait_for_foreground(lambda hwnd: True)
+
+    def _wait_for_window(window):
+        _wait_for_foreground(lambda hwnd: hwnd == window._hWnd, check_current=True)
+
+else:
+
+    def _find_window_by_title(regex):
+        for window in gw.getAllWindows():
+            if regex.search(window.title):
+                return window
+        return None
+
+    def _wait_for_foreground_change():
+        active_window = gw.getActiveWindow()
+        last_active_title = active_window.title if active_window else None
+        while True:
+            sleep(1)
+            active_window = gw.getActiveWindow()
+            if active_window and active_window.title != last_active_title:
+                return
+
+    def _wait_for_window(window):
+        while not window.isActive:
+            sleep(1)
+
+
+def _paste(text):
+    """
+    Types `text` in one go through the clipboard, returns False if the
+    clipboard isn't usable so the caller can fall back to typewrite.
+    """
+    try:
+        import pyperclip
+
+        pyperclip.copy(text)
+    except Exception:  # noqa
+        return False
+
+    pyautogui.hotkey("command" if sys.platform == "darwin" else "ctrl", "v")
+    return True
 
 
 @click.command()
@@ -26,7 +163,12 @@ def apply_slice(text, slice_):
     help="Apply slicing to text input (e.g., [1:-1], [::-1]).",
 )
 @click.option("-d", "--delay", type=int, default=1, help="Delay before typing starts.")
-@click.option("--interval", type=int, default=0.1, help="Interval between key presses.")
+@click.option("--interval", type=float, default=0, help="Interval between key presses.")
+@click.option(
+    "--paste/--no-paste",
+    default=None,
+    help="Paste the text through the clipboard (default when interval is 0).",
+)
 @click.option(
     "-owc", "--on-window-change", is_flag=True, help="Trigger only on window change."
 )
@@ -35,7 +177,9 @@ def apply_slice(text, slice_):
     "-owt", "--own-title", type=str, help="Specify window title (supports regex)."
 )
 @click.argument("text", default="", required=False)
-def main(file, segment, delay, interval, on_window_change, own_name, own_title, text):
+def main(
+    file, segment, delay, interval, paste, on_window_change, own_name, own_title, text
+):
     if file:
         text = read_text_from_file(file, segment)
     elif text:
@@ -47,29 +191,22 @@ def main(file, segment, delay, interval, on_window_change, own_name, own_title,
         if windows:
             target_window = windows[0]
     elif own_title:
-        regex = re.compile(own_title)
-        for window in gw.getAllWindows():
-            if regex.search(window.title):
-                target_window = window
-                break
+        target_window = _find_window_by_title(re.compile(own_title))
 
-    last_active_title = None
     while True:
         if on_window_change:
-            active_window = gw.getActiveWindow()
-            if not active_window or active_window.title == last_active_title:
-                sleep(1)
-                continue
-            last_active_title = active_window.title
+            _wait_for_foreground_change()
 
-        if target_window:
-            while not target_window.isActive:
-                sleep(1)
+        if target_window and not target_window.isActive:
+            _wait_for_window(target_window)
 
         if delay:
             sleep(delay)
 
-        pyautogui.typewrite(text, interval=interval)
+        if paste is None:
+            paste = not interval
+        if not (paste and _paste(text)):
+            pyautogui.typewrite(text, interval=interval)
         break  # Remove or modify this line based on whether you want to keep re-triggering.
 
 
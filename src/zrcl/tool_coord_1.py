@@ -1,9 +1,20 @@
+import queue
 import tkinter as tk
 from tkinter import ttk
 import pyautogui
 import screeninfo
 import pygetwindow as gw
 
+try:
+    # event driven updates when available, polling otherwise
+    from pynput import mouse
+except ImportError:
+    mouse = None
+
+# how often the Tk thread checks for queued moves when Tcl isn't threaded and
+# the mouse listener can't wake it directly
+MOVE_POLL_MS = 100
+
 
 class MouseCoordinateTracker:
     """
@@ -33,7 +44,33 @@ class MouseCoordinateTracker:
         self.root.title(f"Mouse Coordinate Tracker {screen_size}")
 
         # Start updating coordinates
-        self.update_coordinates()
+        self._label_text = None
+        self._update_pending = False
+        if mouse is not None:
+            # redraw only when the cursor moves or an option changes
+            for var in (self.extra_option_var, self.monitor_var, self.window_var):
+                var.trace_add("write", lambda *_: self._schedule_update())
+            # the listener runs on its own thread; a threaded Tcl marshals
+            # event_generate onto the Tk thread, so each burst of moves wakes
+            # Tk once. Otherwise moves are queued and drained on a slow poll
+            self._threaded = self.root.tk.getboolean(
+                self.root.tk.call("info", "exists", "tcl_platform(threaded)")
+            )
+            if self._threaded:
+                self._wake_pending = False
+                self.root.bind("<<MouseMoved>>", self._on_mouse_moved)
+                on_move = self._post_move
+            else:
+                self._moves = queue.SimpleQueue()
+                on_move = lambda x, y: self._moves.put(None)  # noqa: E731
+            self._listener = mouse.Listener(on_move=on_move)
+            self._listener.start()
+            self.root.protocol("WM_DELETE_WINDOW", self.close)
+            self._refresh_label()
+            if not self._threaded:
+                self._drain_moves()
+        else:
+            self.update_coordinates()
 
     def create_footer(self):
         """
@@ -68,18 +105,21 @@ class MouseCoordinateTracker:
         """
         Refresh options for monitors and windows
         """
-        # Update monitor options
+        # Update monitor options, kept until the next refresh so the update
+        # loop doesn't enumerate monitors on every tick
+        self.monitors = screeninfo.get_monitors()
         monitor_options = ["None"] + [
-            f"Monitor {i+1}" for i in range(len(screeninfo.get_monitors()))
+            f"Monitor {i+1}" for i in range(len(self.monitors))
         ]
         self.monitor_dropdown["values"] = monitor_options
         self.monitor_dropdown.set("None")
 
-        # Update window options
+        # Update window options, fetching each title once
+        titled_windows = [(w.title, w) for w in gw.getAllWindows()]
         self.window_options = {
-            w.title: w
-            for w in gw.getAllWindows()
-            if not w.title.startswith("<") and w.title != ""
+            title: w
+            for title, w in titled_windows
+            if not title.startswith("<") and title != ""
         }
         self.window_dropdown["values"] = ["None"] + list(self.window_options.keys())
         self.window_var.set("None")
@@ -96,9 +136,8 @@ class MouseCoordinateTracker:
 
         if monitor_selected.startswith("Monitor") and self.extra_option_var.get():
             monitor_index = int(monitor_selected.split()[1]) - 1
-            monitors = screeninfo.get_monitors()
-            if monitor_index < len(monitors):
-                monitor = monitors[monitor_index]
+            if monitor_index < len(self.monitors):
+                monitor = self.monitors[monitor_index]
                 x -= monitor.x
                 y -= monitor.y
             coordinate_text = f"Monitor Relative: {x}, {y}"
@@ -107,24 +146,83 @@ class MouseCoordinateTracker:
             and self.extra_option_var.get()
             and window_selected in self.window_options
         ):
-            window = self.window_options[window_selected]
-            x -= window.left
-            y -= window.top
-            coordinate_text = (
-                f"Window Relative: {x}/{window.width}, {y}/{window.height}"
-            )
+            # one rect query per tick instead of one per left/top/width/height
+            left, top, width, height = self.window_options[window_selected].box
+            x -= left
+            y -= top
+            coordinate_text = f"Window Relative: {x}/{width}, {y}/{height}"
+
+        self._set_label(coordinate_text)
+
+    def _set_label(self, coordinate_text):
+        # skip the widget repaint when nothing changed
+        if coordinate_text != self._label_text:
+            self._label_text = coordinate_text
+            self.coordinate_label.config(text=coordinate_text)
+
+    def _refresh_label(self):
+        self._update_pending = False
+        try:
+            self._internal_update()
+        except Exception:  # noqa
+            self._set_label("Error")
+
+    def _schedule_update(self):
+        """
+        Queue a label refresh, coalescing bursts of events into a single
+        update. Must be called from the Tk thread.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self.root.after_idle(self._refresh_label)
+
+    def _post_move(self, x, y):
+        """
+        Listener thread: wake Tk unless a wakeup is already on its way
+        """
+        if self._wake_pending:
+            return
+        self._wake_pending = True
+        try:
+            self.root.event_generate("<<MouseMoved>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            # the window is gone or the main loop has stopped; stop listening
+            return False
 
-        self.coordinate_label.config(text=coordinate_text)
+    def _on_mouse_moved(self, event):
+        self._wake_pending = False
+        self._schedule_update()
+
+    def _drain_moves(self):
+        """
+        Pick up the moves queued by the mouse listener when Tcl isn't threaded;
+        the label is only touched when the mouse actually moved since the last check
+        """
+        moved = False
+        try:
+            while True:
+                self._moves.get_nowait()
+                moved = True
+        except queue.Empty:
+            pass
+        if moved:
+            self._schedule_update()
+        self.root.after(MOVE_POLL_MS, self._drain_moves)
+
+    def close(self):
+        """
+        Stop the mouse listener and close the window
+        """
+        listener = getattr(self, "_listener", None)
+        if listener is not None:
+            listener.stop()
+        self.root.destroy()
 
     def update_coordinates(self):
         """
         Update the coordinates and schedule the next update
         """
-        try:
-            self._internal_update()
-        except Exception:  # noqa
-            coordinate_text = "Error"
-            self.coordinate_label.config(text=coordinate_text)
+        self._refresh_label()
         self.root.after(100, self.update_coordinates)
 
 
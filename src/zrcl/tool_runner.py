@@ -1,32 +1,43 @@
 import sys
 import click
 import importlib
-import os
 
 incase_args = sys.argv[2:]
 
-# Dictionary to store modules
-pkgs = {}
+try:
+    # tool name -> (module, entry point, docstring), generated at build time so
+    # nothing is discovered or imported until a tool actually runs
+    from zrcl._tools_manifest import TOOLS
+except ImportError:  # a source tree that hasn't been built yet
+    from zrcl.build_manifest import scan_tools
 
-# Get the current directory where the script is located
-currentDir = os.path.dirname(os.path.realpath(__file__))
+    TOOLS = scan_tools()
 
-# Loop through all packages that start with 'tool_' in the current directory
-for file in os.listdir(currentDir):
-    name = f"zrcl.{os.path.splitext(file)[0]}"
 
-    if not name.startswith("zrcl.tool_"):
-        continue  # Skip packages that do not start with 'tool_'
+def load_tool(name: str):
+    """
+    Imports the tool registered under `name` and returns its entry point.
+    """
+    module_name, attr, _ = TOOLS[name]
+    return getattr(importlib.import_module(module_name), attr)
 
-    if name == "zrcl.tool_runner":
-        continue
 
-    # Import the module dynamically
-    pkg = importlib.import_module(name)
+def tool_doc(name: str):
+    """
+    Returns the docstring of the tool registered under `name`, without
+    importing it.
+    """
+    return TOOLS[name][2]
 
-    # Check if the module has a 'run' attribute, and add it to the dictionary if it does
-    if hasattr(pkg, "run"):
-        pkgs[name[10:]] = pkg
+
+def __getattr__(name):
+    # `pkgs` (tool name -> imported module) used to be built eagerly on import;
+    # it is still available, but only imports the tools once someone asks
+    if name == "pkgs":
+        pkgs = {tool: importlib.import_module(TOOLS[tool][0]) for tool in TOOLS}
+        globals()["pkgs"] = pkgs
+        return pkgs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CMD(click.Command):
@@ -42,31 +53,36 @@ def cli():
 @cli.command()
 def list():
     """List all available tools."""
-    for name in pkgs.keys():
-        try:
-            click.echo(f"{name}\t\t- {pkgs[name].run.__doc__.strip()}")
-        except AttributeError:
+    for name in TOOLS:
+        doc = tool_doc(name)
+        if doc:
+            click.echo(f"{name}\t\t- {doc.strip()}")
+        else:
             click.echo(f"{name}\t\t- (No description provided)")
 
 
 @cli.command("run", cls=CMD)
 @click.argument(
-    "name", type=click.STRING, shell_complete=lambda _, __, **kwargs: list(pkgs.keys())
+    "name",
+    type=click.STRING,
+    shell_complete=lambda ctx, param, incomplete: [
+        name for name in TOOLS if name.startswith(incomplete)
+    ],
 )
 @click.argument("args", type=click.UNPROCESSED, nargs=-1)
 def _run(name, args):
     """Run a specified tool by name."""
-    if name not in pkgs:
+    if name not in TOOLS:
         click.echo(f"Package {name} not found")
         return
 
-    # Get the package and call its 'run' function
-    pkg = pkgs[name]
+    # Import only the requested tool and get its 'run' function
+    tool = load_tool(name)
 
     # pop first 2 of sys.argv
     sys.argv = (name, *args)
 
-    pkg.run()
+    tool()
 
 
 def run():
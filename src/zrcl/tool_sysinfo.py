@@ -1,8 +1,20 @@
+from functools import lru_cache
 import platform
 import psutil
 import os
 
 
+# core counts don't change while the process runs, so ask the OS once
+@lru_cache(maxsize=None)
+def cpu_cores():
+    return psutil.cpu_count(logical=False)
+
+
+@lru_cache(maxsize=None)
+def cpu_threads():
+    return psutil.cpu_count(logical=True)
+
+
 def run():
     # sysinfo
     # Operating System Information
@@ -13,8 +25,8 @@ def run():
     print("OS Release:", platform.release())
 
     # CPU Information
-    print("CPU Cores:", psutil.cpu_count(logical=False))
-    print("Total CPU Threads:", psutil.cpu_count(logical=True))
+    print("CPU Cores:", cpu_cores())
+    print("Total CPU Threads:", cpu_threads())
 
     # Memory Information
     memory = psutil.virtual_memory()
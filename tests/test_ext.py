@@ -21,4 +21,63 @@ def test_dictkeysdict_1():
     l = DictKeysDict.loadJson(w)
     print(d)
     print(l)
-    assert d == l
\ No newline at end of file
+    assert d == l
+
+
+def test_deep_helpers():
+    from zrcl.ext import get_deep, set_deep, del_deep, set_default_deep
+
+    class Obj:
+        pass
+
+    o = Obj()
+    o.attr = {"a": [1, {"b": 2}]}
+    d = {"x": o, "y": FrozenDict({"z": 3})}
+
+    assert get_deep(d, "x", "attr", "a", "1", "b") == 2
+    assert get_deep(d, "y", "z") == 3
+
+    set_deep(d, "x", "attr", "a", 0, value=5)
+    assert o.attr["a"][0] == 5
+
+    set_default_deep(d, "x", "attr", "a", 1, value="ignored")
+    assert o.attr["a"][1] == {"b": 2}
+    set_default_deep(d, "x", "attr", "c", value=7)
+    assert o.attr["c"] == 7
+
+    del_deep(d, "x", "attr", "a", "1", "b")
+    assert o.attr["a"][1] == {}
+
+
+def test_frozendict_hash():
+    a = FrozenDict({"a": 1, 2: "b"})
+    b = FrozenDict({2: "b", "a": 1})
+
+    assert hash(a) == hash(b)
+    assert {a: 1}[b] == 1
+    assert hash(FrozenDict()) != 0
+
+
+def test_rreplace():
+    from zrcl.ext import rreplace
+
+    assert rreplace("Hello, world!", "world", "codeium", 1) == "Hello, codeium!"
+    assert rreplace("a.b.c", ".", "/", 1) == "a.b/c"
+    assert rreplace("a.b.c", ".", "/", 2) == "a/b/c"
+    assert rreplace("abc", ".", "/", 1) == "abc"
+    assert rreplace("a.b", ".", "/", 0) == "a.b"
+
+
+def test_set_default_deep_padding():
+    import pytest
+    from zrcl.ext import set_default_deep
+
+    d = {"l": [0, 1]}
+    set_default_deep(d, "l", 2, value="appended")
+    assert d["l"] == [0, 1, "appended"]
+
+    with pytest.raises(IndexError):
+        set_default_deep(d, "l", 5, value="x")
+
+    set_default_deep(d, "l", 5, value="x", fillpadding=True)
+    assert d["l"] == [0, 1, "appended", None, None, "x"]
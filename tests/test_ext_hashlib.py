@@ -0,0 +1,55 @@
+import hashlib
+
+from zrcl.ext_hashlib import hash_file
+
+
+def test_hash_file_normalize_newline(tmp_path):
+    data = b"ab\r\ncd\r\r\nxx\r" * 100
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    expected = hashlib.sha256(data.replace(b"\r\n", b"\n")).hexdigest()
+    # small chunk sizes split CRLF pairs across reads
+    for chunk_size in (1, 3, 7, 65536):
+        assert hash_file(str(path), chunk_size=chunk_size) == expected
+
+    assert (
+        hash_file(str(path), normalize_newline=False)
+        == hashlib.sha256(data).hexdigest()
+    )
+
+
+def test_hash_python_directory_is_stable(tmp_path):
+    from zrcl.ext_hashlib import hash_python_directory
+
+    for i in range(20):
+        (tmp_path / f"mod{i}.py").write_text(f"x = {i}\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "skip.py").write_text("ignored")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    first = hash_python_directory(str(tmp_path))
+    assert first == hash_python_directory(str(tmp_path))
+
+    (tmp_path / "__pycache__" / "skip.py").write_text("changed")
+    assert first == hash_python_directory(str(tmp_path))
+
+    (tmp_path / "mod3.py").write_text("x = -1\n")
+    assert first != hash_python_directory(str(tmp_path))
+
+
+def test_hash_file_large_uses_same_digest(tmp_path, monkeypatch):
+    import zrcl.ext_hashlib as ext_hashlib
+
+    data = b"line\r\n" * 5000 + b"\r"
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+
+    small = hash_file(str(path), chunk_size=4096)
+    small_raw = hash_file(str(path), normalize_newline=False)
+
+    # force the mmap path
+    monkeypatch.setattr(ext_hashlib, "MMAP_THRESHOLD", 1)
+    assert hash_file(str(path), chunk_size=4095) == small
+    assert hash_file(str(path), normalize_newline=False) == small_raw
+    assert small == hashlib.sha256(data.replace(b"\r\n", b"\n")).hexdigest()
@@ -0,0 +1,15 @@
+from zrcl.ext_re import should_include
+
+
+def test_should_include():
+    assert should_include("a.txt", ["*.txt"])
+    assert not should_include("a.txt", [], ["*.txt"])
+    assert should_include("temp_x.py", ["temp_*"])
+    assert not should_include("foo.py", ["foo"])
+    assert should_include("foo", ["foo", "*.py"], ["*.txt"])
+    assert not should_include("b.md", ["*.txt", "*.py"])
+    assert not should_include("b.py", ["*.txt", "*.py"], ["b.py"])
+    assert should_include("anything")
+    assert should_include("data_1.csv", ["data_?.csv"])
+    assert not should_include("data_12.csv", ["data_?.csv"])
+    assert should_include("b.py", ["[ab].py"])
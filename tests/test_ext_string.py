@@ -0,0 +1,26 @@
+from string import Formatter
+
+from zrcl.ext_string import extract_fstring_keys
+
+
+def _reference_keys(string):
+    try:
+        return [x[1] for x in Formatter().parse(string) if x[1] is not None]
+    except ValueError:
+        return []
+
+
+def test_extract_fstring_keys_matches_formatter():
+    for string in (
+        "plain",
+        "{a} and {b!r:>10} {{escaped}}",
+        "{0.attr}{}",
+        "{a[0]} {b[key]}",
+        "{a[:]}",
+        "{a[}",
+        "{a!x}",
+        "{a:{b}}",
+        "{unbalanced",
+        "}",
+    ):
+        assert extract_fstring_keys(string) == _reference_keys(string), string
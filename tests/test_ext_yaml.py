@@ -77,6 +77,9 @@ def test_floyaml_1():
     assert parsed["val2", "val3[1]"] == {"__val__": 4, "val5": 5}
 
     dumped = parsed.dumps()
+    reparsed = FloYaml(dumped)
+    assert reparsed["val2", FloYaml.VAL("val3")] == [4,4,6]
+    assert reparsed["val2", "val3[2]", "val5[1]"] == 11
     dumped = dumped.splitlines()
 
 def test_floyaml_2():
@@ -1,18 +1,73 @@
-
-def test_fileproperty():
+def test_fileproperty(tmp_path):
     from zrcl.file import FileProperty
 
-    with open("test.toml", "w") as f:
+    path = str(tmp_path / "test.toml")
+    with open(path, "w") as f:
         f.write("test = 1\n")
 
     class test:
-        x = FileProperty("test.toml")
+        x = FileProperty(path)
 
     assert test.x["test"] == 1
 
-    with open("test.toml", "w") as f:
+    with open(path, "w") as f:
         f.write("test = 2\n")
 
     assert test.x["test"] == 2
 
 
+def test_folderwatcher_notify_matches_poll(tmp_path):
+    from zrcl.file import FolderWatcher
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x").write_text("1")
+    (tmp_path / "y").write_text("1")
+
+    watchers = [
+        FolderWatcher(str(tmp_path), deep=True, mode=mode)
+        for mode in ("poll", "notify")
+    ]
+    for watcher in watchers:
+        watcher.track_changes()  # settle
+
+    (tmp_path / "y").unlink()
+    (tmp_path / "a" / "x").write_text("22")
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "q").write_text("")
+
+    results = []
+    for watcher in watchers:
+        watcher.track_changes()
+        results.append(
+            (sorted(watcher.created), sorted(watcher.deleted), sorted(watcher.modified))
+        )
+        watcher.close()
+
+    assert results[0] == results[1]
+    assert results[0][0] == [str(tmp_path / "new"), str(tmp_path / "new" / "q")]
+
+
+def test_folderwatcher_notify_matches_poll_shallow(tmp_path):
+    from zrcl.file import FolderWatcher
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "x").write_text("1")
+
+    watchers = [FolderWatcher(str(tmp_path), mode=mode) for mode in ("poll", "notify")]
+    for watcher in watchers:
+        watcher.track_changes()  # settle
+
+    (tmp_path / "sub" / "x").write_text("22")
+    (tmp_path / "sub" / "q").write_text("")
+    (tmp_path / "new").mkdir()
+
+    results = []
+    for watcher in watchers:
+        watcher.track_changes()
+        results.append(
+            (sorted(watcher.created), sorted(watcher.deleted), sorted(watcher.modified))
+        )
+        watcher.close()
+
+    assert results[0] == results[1]
+    assert results[0][2] == [str(tmp_path / "sub")]
@@ -0,0 +1,64 @@
+from PIL import Image
+
+from zrcl.png_zip import PngZip
+
+
+def test_pngzip_roundtrip(tmp_path):
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    sizes = [(40, 30), (50, 30), (30, 40)]
+    for i, (color, size) in enumerate(zip(colors, sizes)):
+        Image.new("RGB", size, color).save(tmp_path / f"{i}.png")
+
+    archive = str(tmp_path / "out.png")
+    zipped = PngZip(archive, "w")
+    for i in range(len(colors)):
+        zipped[f"img{i}"] = str(tmp_path / f"{i}.png")
+    zipped.save()
+
+    # the saved composite is cropped to the used area
+    with Image.open(archive) as img:
+        assert img.size == (50, 30 + 30 + 40 + 3 * 20)
+
+    loaded = PngZip(archive)
+    for i, (color, size) in enumerate(zip(colors, sizes)):
+        img = loaded[f"img{i}"]
+        assert img.size == size
+        assert img.getpixel((1, 1))[:3] == color
+
+
+def test_pngzip_keeps_originals(tmp_path):
+    Image.new("RGB", (40, 30), (255, 0, 0)).save(tmp_path / "small.png")
+    Image.new("RGB", (400, 300), (0, 0, 255)).save(tmp_path / "big.png")
+    Image.new("RGB", (40, 30), (0, 255, 0)).save(tmp_path / "photo.jpg")
+
+    archive = str(tmp_path / "out.png")
+    zipped = PngZip(archive, "w")
+    zipped["small"] = str(tmp_path / "small.png")
+    zipped["big"] = str(tmp_path / "big.png")
+    zipped["photo"] = str(tmp_path / "photo.jpg")
+    zipped.save()
+
+    loaded = PngZip(archive)
+    assert loaded.metadata["big"]["is_preview"]
+    assert loaded["big"].size == (400, 300)
+    assert loaded["photo"].format == "JPEG"
+    assert loaded["photo"].size == (40, 30)
+
+
+def test_pngzip_get_raw(tmp_path):
+    Image.new("RGB", (40, 30), (255, 0, 0)).save(tmp_path / "small.png")
+    Image.new("RGB", (40, 30), (0, 255, 0)).save(tmp_path / "photo.jpg")
+
+    archive = str(tmp_path / "out.png")
+    zipped = PngZip(archive, "w")
+    zipped["small"] = str(tmp_path / "small.png")
+    zipped["photo"] = str(tmp_path / "photo.jpg")
+    zipped.save()
+
+    loaded = PngZip(archive)
+    assert loaded.get_raw("photo") == (
+        (tmp_path / "photo.jpg").read_bytes(),
+        "JPEG",
+    )
+    data, fmt = loaded.get_raw("small")
+    assert fmt == "PNG" and data.startswith(b"\x89PNG")
@@ -0,0 +1,20 @@
+import sys
+
+from click.testing import CliRunner
+
+from zrcl.tool_runner import TOOLS, cli
+
+
+def test_list_does_not_import_tools():
+    result = CliRunner().invoke(cli, ["list"])
+    assert result.exit_code == 0
+    assert "btype\t\t- a typewriter" in result.output
+    for name in TOOLS:
+        assert f"zrcl.tool_{name}" not in sys.modules
+
+
+def test_manifest_is_up_to_date():
+    from zrcl.build_manifest import scan_tools
+
+    # regenerate with `python -m zrcl.build_manifest` when this fails
+    assert scan_tools() == TOOLS